@@ -5,6 +5,7 @@ Streamlit web interface for ReSynth
 import streamlit as st
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 
 # Add the project root to Python path
@@ -25,8 +26,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS - module-level constant so reruns reuse the interned string
+# instead of rebuilding it
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -67,17 +69,64 @@ st.markdown("""
         color: #7f8c8d;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# Prebuilt template for source-chunk cards, filled with format_map per chunk
+_CARD_TEMPLATE = """
+<div class="paper-card">
+    <strong>Chunk {index}</strong> - Similarity: {similarity:.3f}
+    <br><strong>Paper:</strong> {paper_title}
+    <br><strong>Authors:</strong> {authors}
+    <br><div class="chunk-info">{excerpt}...</div>
+</div>
+"""
+
+# Shared heavy resources - cached once per process, not per session
+@st.cache_resource
+def get_vector_store():
+    """Get the shared vector store (loads the embedding model once)"""
+    return VectorStore()
+
+@st.cache_resource
+def get_retriever():
+    """Get the shared retriever"""
+    return Retriever(get_vector_store())
 
-# Initialize session state
+@st.cache_resource
+def get_synthesizer():
+    """Get the shared answer synthesizer"""
+    return AnswerSynthesizer()
+
+# Cached data helpers - keyed on query parameters plus a database version
+# counter so results survive reruns but invalidate when papers are ingested
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_retrieve(query: str, top_k: int, similarity_threshold: float, db_version: int):
+    """Retrieve chunks for a query, cached across Streamlit reruns"""
+    return get_retriever().retrieve(query, top_k=top_k, similarity_threshold=similarity_threshold)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_quality(query: str, top_k: int, similarity_threshold: float, db_version: int):
+    """Validate retrieval quality, cached across Streamlit reruns"""
+    chunks = cached_retrieve(query, top_k, similarity_threshold, db_version)
+    return get_retriever().validate_retrieval_quality(query, chunks)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_paper_chunks(paper_title: str, db_version: int):
+    """Get chunks for one paper, cached so rerenders skip the store query"""
+    return get_retriever().retrieve_by_paper(paper_title, top_k=10)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_statistics(db_version: int):
+    """Get retrieval statistics, cached briefly to avoid hitting the store on every rerun"""
+    return get_retriever().get_retrieval_statistics()
+
+# Initialize session state (user-mutable data only)
 if 'processed_papers' not in st.session_state:
     st.session_state.processed_papers = []
-if 'vector_store' not in st.session_state:
-    st.session_state.vector_store = VectorStore()
-if 'retriever' not in st.session_state:
-    st.session_state.retriever = Retriever(st.session_state.vector_store)
-if 'synthesizer' not in st.session_state:
-    st.session_state.synthesizer = AnswerSynthesizer()
+if 'db_version' not in st.session_state:
+    st.session_state.db_version = 0
 
 def main():
     """Main Streamlit application"""
@@ -90,25 +139,29 @@ def main():
     with st.sidebar:
         st.markdown("## Settings")
         
-        # Citation style
-        citation_style = st.selectbox(
+        # Citation style (stored in session_state so tab fragments can read
+        # the values without a full-app rerun)
+        st.selectbox(
             "Citation Style",
             options=["numeric", "apa", "mla", "author_date"],
-            index=0
+            index=0,
+            key="citation_style"
         )
-        
+
         # Retrieval settings
         st.markdown("### Retrieval Settings")
-        top_k = st.slider("Top K Results", min_value=1, max_value=20, value=5)
-        similarity_threshold = st.slider("Similarity Threshold", min_value=0.0, max_value=1.0, value=0.7, step=0.05)
+        st.slider("Top K Results", min_value=1, max_value=20, value=5, key="top_k")
+        st.slider("Similarity Threshold", min_value=0.0, max_value=1.0, value=0.7, step=0.05,
+                  key="similarity_threshold")
         
         # System info
         st.markdown("### System Info")
         if st.button("Refresh Stats"):
+            cached_statistics.clear()
             st.rerun()
-        
+
         try:
-            stats = st.session_state.retriever.get_retrieval_statistics()
+            stats = cached_statistics(st.session_state.db_version)
             collection_stats = stats.get('collection_stats', {})
             st.metric("Total Chunks", collection_stats.get('total_chunks', 0))
             st.metric("Total Papers", stats.get('total_papers', 0))
@@ -118,7 +171,9 @@ def main():
         # Clear database button
         if st.button("Clear Database", type="secondary"):
             try:
-                st.session_state.vector_store.clear_collection()
+                get_vector_store().clear_collection()
+                st.session_state.db_version += 1
+                cached_statistics.clear()
                 st.success("Database cleared!")
                 st.rerun()
             except Exception as e:
@@ -131,11 +186,23 @@ def main():
         search_and_process_tab()
     
     with tab2:
-        query_tab(citation_style, top_k, similarity_threshold)
-    
+        query_tab()
+
     with tab3:
         database_tab()
 
+def deduplicate_papers(papers):
+    """Drop papers returned by more than one source (by DOI/ID/title)"""
+    seen = set()
+    unique_papers = []
+    for paper in papers:
+        key = paper.doi or paper.arxiv_id or paper.pubmed_id or paper.title.lower().strip()
+        if key not in seen:
+            seen.add(key)
+            unique_papers.append(paper)
+    return unique_papers
+
+@st.fragment
 def search_and_process_tab():
     """Search and process papers tab"""
     st.markdown('<div class="section-header">Search & Process Papers</div>', unsafe_allow_html=True)
@@ -174,38 +241,52 @@ def search_and_process_tab():
                 arxiv_fetcher = ArxivFetcher(max_results=max_papers)
                 pubmed_fetcher = PubmedFetcher(max_results=max_papers)
                 
-                # Search for papers
-                papers = []
+                # Search for papers (both sources run concurrently, so total
+                # latency is max(arxiv, pubmed) instead of the sum)
+                fetchers = []
                 if source in ["arxiv", "both"]:
-                    st.info("🔎 Searching arXiv...")
-                    arxiv_papers = arxiv_fetcher.search(query)
-                    papers.extend(arxiv_papers)
-                    st.success(f"Found {len(arxiv_papers)} papers from arXiv")
-                
+                    fetchers.append(("arXiv", arxiv_fetcher))
                 if source in ["pubmed", "both"]:
-                    st.info("🔎 Searching PubMed...")
-                    pubmed_papers = pubmed_fetcher.search(query)
-                    papers.extend(pubmed_papers)
-                    st.success(f"Found {len(pubmed_papers)} papers from PubMed")
+                    fetchers.append(("PubMed", pubmed_fetcher))
+
+                st.info(f"🔎 Searching {' and '.join(name for name, _ in fetchers)}...")
+                papers = []
+                with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                    results = list(executor.map(
+                        lambda fetcher: fetcher.search(query),
+                        [fetcher for _, fetcher in fetchers]
+                    ))
+                for (name, _), found in zip(fetchers, results):
+                    papers.extend(found)
+                    st.success(f"Found {len(found)} papers from {name}")
                 
                 if not papers:
                     st.error("No papers found")
                     return
-                
-                papers = papers[:max_papers]
+
+                # Deduplicate before fetching so the same paper is never
+                # downloaded twice and users get more unique results
+                papers = deduplicate_papers(papers)[:max_papers]
                 st.info(f"Processing {len(papers)} papers...")
                 
-                # Fetch full content if requested
+                # Fetch full content if requested (concurrently - each fetch
+                # is a blocking HTTP round-trip)
                 if fetch_content:
                     progress_bar = st.progress(0)
-                    for i, paper in enumerate(papers):
+
+                    def fetch_content_for(paper):
                         if paper.arxiv_id:
-                            content = arxiv_fetcher.fetch_paper_content(paper)
-                            paper.content = content
+                            return arxiv_fetcher.fetch_paper_content(paper)
                         elif paper.pubmed_id:
-                            content = pubmed_fetcher.fetch_paper_content(paper)
-                            paper.content = content
-                        progress_bar.progress((i + 1) / len(papers))
+                            return pubmed_fetcher.fetch_paper_content(paper)
+                        return ""
+
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        futures = {executor.submit(fetch_content_for, paper): paper
+                                   for paper in papers}
+                        for done, future in enumerate(as_completed(futures), 1):
+                            futures[future].content = future.result()
+                            progress_bar.progress(done / len(papers))
                 
                 # Chunk papers
                 st.info("Chunking papers...")
@@ -214,11 +295,13 @@ def search_and_process_tab():
                 
                 # Add to vector store
                 st.info("Adding to vector store...")
-                success = st.session_state.vector_store.add_chunks(chunks)
+                success = get_vector_store().add_chunks(chunks)
                 
                 if success:
                     st.success(f"Successfully processed {len(papers)} papers into {len(chunks)} chunks!")
                     st.session_state.processed_papers.extend(papers)
+                    st.session_state.db_version += 1
+                    cached_statistics.clear()
                     
                     # Display processed papers
                     st.markdown('<div class="section-header">Processed Papers</div>', unsafe_allow_html=True)
@@ -264,10 +347,15 @@ def search_and_process_tab():
             except Exception as e:
                 st.error(f"Error processing papers: {e}")
 
-def query_tab(citation_style: str, top_k: int, similarity_threshold: float):
+@st.fragment
+def query_tab():
     """Query papers tab"""
     st.markdown('<div class="section-header">Query Papers</div>', unsafe_allow_html=True)
-    
+
+    citation_style = st.session_state.citation_style
+    top_k = st.session_state.top_k
+    similarity_threshold = st.session_state.similarity_threshold
+
     query = st.text_input(
         "Enter your question",
         placeholder="e.g., What are the main challenges in deep learning interpretability?",
@@ -278,29 +366,29 @@ def query_tab(citation_style: str, top_k: int, similarity_threshold: float):
         with st.spinner("Retrieving relevant information and synthesizing answer..."):
             try:
                 # Retrieve relevant chunks
-                chunks = st.session_state.retriever.retrieve(
-                    query, 
-                    top_k=top_k, 
-                    similarity_threshold=similarity_threshold
-                )
-                
+                db_version = st.session_state.db_version
+                chunks = cached_retrieve(query, top_k, similarity_threshold, db_version)
+
                 if not chunks:
                     st.warning("No relevant information found. Try processing some papers first.")
                     return
-                
+
                 # Validate retrieval quality
-                quality = st.session_state.retriever.validate_retrieval_quality(query, chunks)
-                
-                # Synthesize answer
-                answer_obj = st.session_state.synthesizer.synthesize_answer(
-                    query, chunks, citation_style=citation_style
-                )
-                
-                # Display answer
+                quality = cached_quality(query, top_k, similarity_threshold, db_version)
+
+                # Display answer, streamed token-by-token as it is generated
                 st.markdown('<div class="answer-box">', unsafe_allow_html=True)
                 st.markdown("### Answer")
-                st.write(answer_obj.answer)
+                streamed_answer = st.write_stream(
+                    get_synthesizer().synthesize_answer_stream(query, chunks)
+                )
                 st.markdown('</div>', unsafe_allow_html=True)
+
+                # Attach citations, bibliography and confidence once the
+                # stream has drained
+                answer_obj = get_synthesizer().finalize_answer(
+                    query, streamed_answer, chunks, citation_style=citation_style
+                )
                 
                 # Display confidence
                 confidence_color = "Green" if answer_obj.confidence_score > 0.7 else "Yellow" if answer_obj.confidence_score > 0.5 else "Red"
@@ -330,19 +418,23 @@ def query_tab(citation_style: str, top_k: int, similarity_threshold: float):
                         for suggestion in quality['suggestions']:
                             st.write(f"Suggestion: {suggestion}")
                 
-                # Display source chunks
+                # Display source chunks (all cards concatenated into a single
+                # markdown call - one Streamlit op instead of one per chunk)
                 with st.expander(f"Source Chunks ({len(chunks)})"):
+                    cards = []
                     for i, chunk in enumerate(chunks):
                         metadata = chunk.get('metadata', {})
-                        
-                        st.markdown(f"""
-                        <div class="paper-card">
-                            <strong>Chunk {i+1}</strong> - Similarity: {chunk.get('similarity', 0):.3f}
-                            <br><strong>Paper:</strong> {metadata.get('paper_title', 'Unknown')}
-                            <br><strong>Authors:</strong> {', '.join(metadata.get('paper_authors', [])[:3])}{'...' if len(metadata.get('paper_authors', [])) > 3 else ''}
-                            <br><div class="chunk-info">{chunk.get('text', '')[:300]}...</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        authors = metadata.get('paper_authors', [])
+
+                        cards.append(_CARD_TEMPLATE.format_map({
+                            'index': i + 1,
+                            'similarity': chunk.get('similarity', 0),
+                            'paper_title': metadata.get('paper_title', 'Unknown'),
+                            'authors': ', '.join(authors[:3]) + ('...' if len(authors) > 3 else ''),
+                            'excerpt': chunk.get('text', '')[:300]
+                        }))
+
+                    st.markdown("".join(cards), unsafe_allow_html=True)
                 
                 # Display bibliography
                 if answer_obj.bibliography:
@@ -352,13 +444,14 @@ def query_tab(citation_style: str, top_k: int, similarity_threshold: float):
             except Exception as e:
                 st.error(f"Error processing query: {e}")
 
+@st.fragment
 def database_tab():
     """Database information tab"""
     st.markdown('<div class="section-header">Database Information</div>', unsafe_allow_html=True)
     
     try:
         # Get statistics
-        stats = st.session_state.retriever.get_retrieval_statistics()
+        stats = cached_statistics(st.session_state.db_version)
         collection_stats = stats.get('collection_stats', {})
         papers = stats.get('papers', [])
         
@@ -393,14 +486,14 @@ def database_tab():
             for i, paper in enumerate(filtered_papers):
                 with st.expander(f"{paper}"):
                     # Get chunks for this paper
-                    paper_chunks = st.session_state.retriever.retrieve_by_paper(paper, top_k=10)
+                    paper_chunks = cached_paper_chunks(paper, st.session_state.db_version)
                     
                     if paper_chunks:
                         st.write(f"Chunks available: {len(paper_chunks)}")
                         
                         # Show sample chunks
                         for j, chunk in enumerate(paper_chunks[:3]):
-                            with st.expander(f"Chunk {j+1} (Similarity: {chunk.get('similarity', 0):.3f})"):
+                            with st.expander(f"Chunk {j+1}"):
                                 st.write(chunk.get('text', ''))
                     else:
                         st.write("No chunks found for this paper")
@@ -5,14 +5,36 @@ Command-line interface for ReSynth
 import argparse
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 
-from src.fetchers import ArxivFetcher, PubmedFetcher
-from src.processors import SemanticChunker
-from src.embeddings import VectorStore
-from src.retrieval import Retriever
-from src.synthesis import AnswerSynthesizer
-from config import Config
+from functools import lru_cache
+
+# Heavy modules (torch, chromadb, spacy) are imported lazily inside the
+# action functions so lightweight commands like --stats start quickly
+
+@lru_cache(maxsize=1)
+def get_vector_store():
+    """Get the shared vector store (loads the embedding model once)"""
+    from src.embeddings import VectorStore
+    return VectorStore()
+
+@lru_cache(maxsize=1)
+def get_retriever():
+    """Get the shared retriever"""
+    from src.retrieval import Retriever
+    return Retriever(get_vector_store())
+
+def deduplicate_papers(papers):
+    """Drop papers returned by more than one source (by DOI/ID/title)"""
+    seen = set()
+    unique_papers = []
+    for paper in papers:
+        key = paper.doi or paper.arxiv_id or paper.pubmed_id or paper.title.lower().strip()
+        if key not in seen:
+            seen.add(key)
+            unique_papers.append(paper)
+    return unique_papers
 
 def setup_argparser():
     """Setup command line argument parser"""
@@ -68,6 +90,10 @@ Examples:
 def search_and_process_papers(query: str, source: str, max_papers: int, 
                              fetch_content: bool, verbose: bool):
     """Search for papers and process them"""
+    from src.fetchers import ArxivFetcher, PubmedFetcher
+    from src.processors import SemanticChunker
+    from config import Config
+
     print(f"Searching for papers: '{query}'")
     print(f"Source: {source}")
     print(f"Max papers: {max_papers}")
@@ -76,40 +102,54 @@ def search_and_process_papers(query: str, source: str, max_papers: int,
     arxiv_fetcher = ArxivFetcher(max_results=max_papers)
     pubmed_fetcher = PubmedFetcher(max_results=max_papers)
     
-    # Search for papers
-    papers = []
+    # Search for papers (both sources run concurrently, so total latency is
+    # max(arxiv, pubmed) instead of the sum)
+    fetchers = []
     if source in ["arxiv", "both"]:
-        print("Searching arXiv...")
-        arxiv_papers = arxiv_fetcher.search(query)
-        papers.extend(arxiv_papers)
-        print(f"   Found {len(arxiv_papers)} papers from arXiv")
-    
+        fetchers.append(("arXiv", arxiv_fetcher))
     if source in ["pubmed", "both"]:
-        print("Searching PubMed...")
-        pubmed_papers = pubmed_fetcher.search(query)
-        papers.extend(pubmed_papers)
-        print(f"   Found {len(pubmed_papers)} papers from PubMed")
+        fetchers.append(("PubMed", pubmed_fetcher))
+
+    print(f"Searching {' and '.join(name for name, _ in fetchers)}...")
+    papers = []
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        results = list(executor.map(
+            lambda fetcher: fetcher.search(query),
+            [fetcher for _, fetcher in fetchers]
+        ))
+    for (name, _), found in zip(fetchers, results):
+        papers.extend(found)
+        print(f"   Found {len(found)} papers from {name}")
     
     if not papers:
         print("No papers found")
         return
-    
-    papers = papers[:max_papers]
+
+    # Deduplicate before fetching so the same paper is never downloaded
+    # twice and users get more unique results
+    papers = deduplicate_papers(papers)[:max_papers]
     print(f"Processing {len(papers)} papers")
     
-    # Fetch full content if requested
+    # Fetch full content if requested (concurrently - each fetch is a
+    # blocking HTTP round-trip)
     if fetch_content:
         print("Fetching full paper content...")
-        for i, paper in enumerate(papers):
-            if verbose:
-                print(f"   [{i+1}/{len(papers)}] {paper.title[:50]}...")
-            
+
+        def fetch_content_for(paper):
             if paper.arxiv_id:
-                content = arxiv_fetcher.fetch_paper_content(paper)
-                paper.content = content
+                return arxiv_fetcher.fetch_paper_content(paper)
             elif paper.pubmed_id:
-                content = pubmed_fetcher.fetch_paper_content(paper)
-                paper.content = content
+                return pubmed_fetcher.fetch_paper_content(paper)
+            return ""
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(fetch_content_for, paper): paper
+                       for paper in papers}
+            for i, future in enumerate(as_completed(futures)):
+                paper = futures[future]
+                paper.content = future.result()
+                if verbose:
+                    print(f"   [{i+1}/{len(papers)}] {paper.title[:50]}...")
     
     # Chunk papers
     print("Chunking papers...")
@@ -119,8 +159,7 @@ def search_and_process_papers(query: str, source: str, max_papers: int,
     
     # Add to vector store
     print("Adding to vector store...")
-    vector_store = VectorStore()
-    success = vector_store.add_chunks(chunks)
+    success = get_vector_store().add_chunks(chunks)
     
     if success:
         print("Successfully processed papers!")
@@ -139,11 +178,12 @@ def search_and_process_papers(query: str, source: str, max_papers: int,
 def query_papers(query: str, top_k: int, threshold: float, citation_style: str, 
                 json_output: bool, verbose: bool):
     """Query the processed papers"""
+    from src.synthesis import AnswerSynthesizer
+
     print(f"Querying papers: '{query}'")
-    
+
     # Initialize components
-    vector_store = VectorStore()
-    retriever = Retriever(vector_store)
+    retriever = get_retriever()
     synthesizer = AnswerSynthesizer()
     
     # Retrieve relevant chunks
@@ -190,7 +230,16 @@ def query_papers(query: str, top_k: int, threshold: float, citation_style: str,
                 for title, citation in answer_obj.citations.items()
             }
         }
-        print(json.dumps(result, indent=2))
+        try:
+            # orjson serializes several times faster than json and lets us
+            # write bytes straight to stdout without an intermediate str
+            import orjson
+            sys.stdout.buffer.write(orjson.dumps(
+                result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+            sys.stdout.write("\n")
+        except ImportError:
+            print(json.dumps(result, indent=2))
     else:
         print("\n" + "="*60)
         print("ANSWER")
@@ -215,9 +264,8 @@ def show_stats():
     """Show system statistics"""
     print("System Statistics")
     print("="*40)
-    
-    vector_store = VectorStore()
-    retriever = Retriever(vector_store)
+
+    retriever = get_retriever()
     
     stats = retriever.get_retrieval_statistics()
     
@@ -240,9 +288,8 @@ def list_papers():
     """List all papers in the database"""
     print("Papers in Database")
     print("="*40)
-    
-    vector_store = VectorStore()
-    papers = vector_store.get_papers_in_collection()
+
+    papers = get_vector_store().get_papers_in_collection()
     
     if not papers:
         print("No papers found in database")
@@ -257,9 +304,8 @@ def list_papers():
 def clear_database():
     """Clear the database"""
     print("Clearing database...")
-    
-    vector_store = VectorStore()
-    success = vector_store.clear_collection()
+
+    success = get_vector_store().clear_collection()
     
     if success:
         print("Database cleared successfully")
@@ -270,8 +316,9 @@ def main():
     """Main CLI entry point"""
     parser = setup_argparser()
     args = parser.parse_args()
-    
+
     # Validate configuration
+    from config import Config
     Config.validate()
     
     try:
@@ -3,6 +3,7 @@ Main application entry point - FastAPI server
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -10,10 +11,6 @@ from typing import List, Optional
 import uvicorn
 
 from src.fetchers import ArxivFetcher, PubmedFetcher
-from src.processors import SemanticChunker
-from src.embeddings import VectorStore
-from src.retrieval import Retriever
-from src.synthesis import AnswerSynthesizer
 from config import Config
 
 # Configure logging
@@ -36,13 +33,48 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize components
+# Flush chunks to the vector store once this many have accumulated
+# during streaming ingestion
+EMBED_FLUSH_SIZE = 64
+
+# Initialize lightweight components at import; the heavy ones (spaCy,
+# sentence-transformers, ChromaDB) load in the startup hook below so the
+# server can bind its port immediately
 arxiv_fetcher = ArxivFetcher(max_results=Config.MAX_PAPERS_PER_QUERY)
 pubmed_fetcher = PubmedFetcher(max_results=Config.MAX_PAPERS_PER_QUERY)
-chunker = SemanticChunker(chunk_size=Config.CHUNK_SIZE, chunk_overlap=Config.CHUNK_OVERLAP)
-vector_store = VectorStore()
-retriever = Retriever(vector_store)
-synthesizer = AnswerSynthesizer()
+chunker = None
+vector_store = None
+retriever = None
+synthesizer = None
+ChunkBatch = None
+
+@app.on_event("startup")
+def load_components():
+    """Import and build the heavy pipeline components in parallel"""
+    global chunker, vector_store, retriever, synthesizer, ChunkBatch
+
+    from src.processors import SemanticChunker, ChunkBatch as _ChunkBatch
+    from src.embeddings import VectorStore
+    from src.retrieval import Retriever
+    from src.synthesis import AnswerSynthesizer
+
+    ChunkBatch = _ChunkBatch
+
+    # The chunker's NLP pipeline and the vector store's embedding model
+    # load independently - build them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        chunker_future = executor.submit(
+            SemanticChunker, chunk_size=Config.CHUNK_SIZE, chunk_overlap=Config.CHUNK_OVERLAP
+        )
+        store_future = executor.submit(VectorStore)
+        synthesizer_future = executor.submit(AnswerSynthesizer)
+
+        chunker = chunker_future.result()
+        vector_store = store_future.result()
+        synthesizer = synthesizer_future.result()
+
+    retriever = Retriever(vector_store)
+    logger.info("Pipeline components loaded")
 
 # Pydantic models
 class SearchRequest(BaseModel):
@@ -80,7 +112,7 @@ async def health_check():
     }}
 
 @app.get("/stats")
-async def get_stats():
+def get_stats():
     """Get system statistics"""
     try:
         stats = retriever.get_retrieval_statistics()
@@ -90,7 +122,7 @@ async def get_stats():
         raise HTTPException(status_code=500, detail="Failed to get statistics")
 
 @app.post("/search")
-async def search_papers(request: SearchRequest):
+def search_papers(request: SearchRequest):
     """Search for papers"""
     try:
         max_papers = request.max_papers or Config.MAX_PAPERS_PER_QUERY
@@ -133,7 +165,7 @@ async def search_papers(request: SearchRequest):
         raise HTTPException(status_code=500, detail="Failed to search papers")
 
 @app.post("/process")
-async def process_papers(request: ProcessPapersRequest):
+def process_papers(request: ProcessPapersRequest):
     """Search, fetch, and process papers into the vector store"""
     try:
         max_papers = request.max_papers or Config.MAX_PAPERS_PER_QUERY
@@ -149,34 +181,78 @@ async def process_papers(request: ProcessPapersRequest):
             papers.extend(pubmed_papers)
         
         papers = papers[:max_papers]
-        
+
         if not papers:
             return {"message": "No papers found", "processed": 0}
-        
-        # Fetch full content if requested
+
+        # Skip papers already ingested - re-running the same query should
+        # not repeat the whole download/chunk/embed pipeline
+        existing_titles = set(vector_store.get_papers_in_collection())
+        skipped = [paper for paper in papers if paper.title in existing_titles]
+        papers = [paper for paper in papers if paper.title not in existing_titles]
+        if skipped:
+            logger.info(f"Skipping {len(skipped)} papers already in the vector store")
+        if not papers:
+            return {
+                "message": "All matching papers are already processed",
+                "papers_found": len(skipped),
+                "chunks_created": 0,
+                "papers_processed": []
+            }
+
+        # Fetch, chunk, and embed as a streaming pipeline: each paper is
+        # chunked as soon as its download completes and chunks are flushed
+        # to the vector store in sub-batches, so the embedding worker runs
+        # while later downloads are still in flight instead of after them
         if request.fetch_content:
-            logger.info(f"Fetching full content for {len(papers)} papers")
-            for paper in papers:
+            logger.info(f"Fetching and processing {len(papers)} papers")
+
+            def fetch_content_for(paper):
                 if paper.arxiv_id:
-                    content = arxiv_fetcher.fetch_paper_content(paper)
-                    paper.content = content
+                    return arxiv_fetcher.fetch_paper_content(paper)
                 elif paper.pubmed_id:
-                    content = pubmed_fetcher.fetch_paper_content(paper)
-                    paper.content = content
-        
-        # Chunk papers
-        logger.info(f"Chunking {len(papers)} papers")
-        chunks = chunker.chunk_multiple_papers(papers)
-        
-        # Add to vector store
-        logger.info(f"Adding {len(chunks)} chunks to vector store")
-        success = vector_store.add_chunks(chunks)
-        
+                    return pubmed_fetcher.fetch_paper_content(paper)
+                return ""
+
+            success = True
+            chunks_created = 0
+            batch = ChunkBatch()
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {executor.submit(fetch_content_for, paper): paper
+                           for paper in papers}
+                for future in as_completed(futures):
+                    paper = futures[future]
+                    try:
+                        paper.content = future.result()
+                        for chunk in chunker.chunk_paper(paper):
+                            batch.append(chunk)
+                    except Exception as e:
+                        logger.error(f"Error processing paper {paper.title}: {e}")
+                        continue
+
+                    if len(batch) >= EMBED_FLUSH_SIZE:
+                        success = vector_store.add_chunks(batch) and success
+                        chunks_created += len(batch)
+                        batch = ChunkBatch()
+
+            if batch:
+                success = vector_store.add_chunks(batch) and success
+                chunks_created += len(batch)
+        else:
+            # Abstract-only processing has no download stage to overlap
+            logger.info(f"Chunking {len(papers)} papers")
+            chunks = chunker.chunk_multiple_papers(papers)
+
+            logger.info(f"Adding {len(chunks)} chunks to vector store")
+            success = vector_store.add_chunks(chunks)
+            chunks_created = len(chunks)
+
         if success:
             return {
                 "message": "Successfully processed papers",
                 "papers_found": len(papers),
-                "chunks_created": len(chunks),
+                "chunks_created": chunks_created,
                 "papers_processed": [
                     {
                         "title": paper.title,
@@ -195,7 +271,7 @@ async def process_papers(request: ProcessPapersRequest):
         raise HTTPException(status_code=500, detail="Failed to process papers")
 
 @app.post("/query")
-async def query_papers(request: QueryRequest):
+def query_papers(request: QueryRequest):
     """Query the processed papers"""
     try:
         # Retrieve relevant chunks
@@ -261,7 +337,7 @@ async def query_papers(request: QueryRequest):
         raise HTTPException(status_code=500, detail="Failed to query papers")
 
 @app.delete("/clear")
-async def clear_database():
+def clear_database():
     """Clear all papers from the vector store"""
     try:
         success = vector_store.clear_collection()
@@ -274,7 +350,7 @@ async def clear_database():
         raise HTTPException(status_code=500, detail="Failed to clear database")
 
 @app.get("/papers")
-async def get_papers():
+def get_papers():
     """Get list of papers in the database"""
     try:
         papers = vector_store.get_papers_in_collection()
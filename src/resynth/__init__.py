@@ -7,23 +7,48 @@ __author__ = "ReSynth Team"
 __email__ = "norizzabhii@gmail.com"
 __license__ = "MIT"
 
-# Import main classes for easy access
-from .fetchers import ArxivFetcher, PubmedFetcher
-from .processors import SemanticChunker, TextProcessor
-from .embeddings import VectorStore, EmbeddingManager
-from .retrieval import Retriever, QueryProcessor
-from .synthesis import AnswerSynthesizer, CitationFormatter
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Public classes resolve lazily (PEP 562) so `import resynth` does not
+# pull spaCy, torch, and chromadb for callers that never touch them
+_LAZY_IMPORTS = {
+    'ArxivFetcher': '.fetchers',
+    'PubmedFetcher': '.fetchers',
+    'SemanticChunker': '.processors',
+    'TextProcessor': '.processors',
+    'VectorStore': '.embeddings',
+    'EmbeddingManager': '.embeddings',
+    'Retriever': '.retrieval',
+    'QueryProcessor': '.retrieval',
+    'AnswerSynthesizer': '.synthesis',
+    'CitationFormatter': '.synthesis',
+}
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = attr
+    return attr
 
 # Main agent class
 class ReSynthAgent:
     """Main ReSynth agent for research paper synthesis"""
-    
+
     def __init__(self, config=None):
         """Initialize the ReSynth agent
-        
+
         Args:
             config: Optional configuration dictionary
         """
+        from .fetchers import ArxivFetcher, PubmedFetcher
+        from .processors import SemanticChunker
+        from .embeddings import VectorStore
+        from .retrieval import Retriever
+        from .synthesis import AnswerSynthesizer
+
         # Initialize components
         self.arxiv_fetcher = ArxivFetcher()
         self.pubmed_fetcher = PubmedFetcher()
@@ -45,15 +70,19 @@ class ReSynthAgent:
             list: List of processed papers
         """
         papers = []
-        
-        # Search for papers
-        if source in ["arxiv", "both"]:
-            arxiv_papers = self.arxiv_fetcher.search(query)
-            papers.extend(arxiv_papers)
-        
-        if source in ["pubmed", "both"]:
-            pubmed_papers = self.pubmed_fetcher.search(query)
-            papers.extend(pubmed_papers)
+
+        # Search both sources concurrently - the aggregate wait becomes
+        # max(arxiv, pubmed) instead of the sum
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            arxiv_future = (executor.submit(self.arxiv_fetcher.search, query)
+                            if source in ["arxiv", "both"] else None)
+            pubmed_future = (executor.submit(self.pubmed_fetcher.search, query)
+                             if source in ["pubmed", "both"] else None)
+
+            if arxiv_future:
+                papers.extend(arxiv_future.result())
+            if pubmed_future:
+                papers.extend(pubmed_future.result())
         
         # Limit results
         papers = papers[:max_papers]
@@ -61,15 +90,18 @@ class ReSynthAgent:
         if not papers:
             return papers
         
-        # Fetch full content if requested
+        # Fetch full content if requested (concurrently - each fetch is
+        # dominated by the network round-trip)
         if fetch_content:
-            for paper in papers:
+            def fetch_content_for(paper):
                 if paper.arxiv_id:
-                    content = self.arxiv_fetcher.fetch_paper_content(paper)
-                    paper.content = content
+                    paper.content = self.arxiv_fetcher.fetch_paper_content(paper)
                 elif paper.pubmed_id:
-                    content = self.pubmed_fetcher.fetch_paper_content(paper)
-                    paper.content = content
+                    paper.content = self.pubmed_fetcher.fetch_paper_content(paper)
+                return paper
+
+            with ThreadPoolExecutor(max_workers=min(8, len(papers))) as executor:
+                list(executor.map(fetch_content_for, papers))
         
         # Chunk papers and add to vector store
         chunks = self.chunker.chunk_multiple_papers(papers)
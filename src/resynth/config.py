@@ -3,77 +3,117 @@ Configuration settings for ReSynth
 """
 
 import os
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 # Try to load .env, but don't fail if it doesn't exist (for Colab/cloud environments)
 load_dotenv(override=False)
 
-class Config:
+# Vector Database - Use /content for Colab, ./ for local
+if os.path.exists("/content"):
+    # Google Colab environment
+    _DEFAULT_PERSIST_DIR = "/content/chroma_db"
+    _DEFAULT_DOWNLOAD_DIR = "/content/papers"
+else:
+    # Local/other environments
+    _DEFAULT_PERSIST_DIR = "./chroma_db"
+    _DEFAULT_DOWNLOAD_DIR = "./papers"
+
+@dataclass(frozen=True)
+class _Config:
+    """Immutable configuration snapshot
+
+    Environment variables are parsed exactly once at import time; frozen
+    fields make the values safe to bind as defaults in hot functions.
+    """
+
     # API Keys
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-    
+    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
+
     # Model Settings
-    HUGGINGFACE_MODEL_NAME = os.getenv("HUGGINGFACE_MODEL_NAME", "sentence-transformers/all-MiniLM-L6-v2")
-    
-    # Vector Database - Use /content for Colab, ./ for local
-    if os.path.exists("/content"):
-        # Google Colab environment
-        CHROMA_PERSIST_DIRECTORY = os.getenv("CHROMA_PERSIST_DIRECTORY", "/content/chroma_db")
-        PAPER_DOWNLOAD_DIR = os.getenv("PAPER_DOWNLOAD_DIR", "/content/papers")
-    else:
-        # Local/other environments
-        CHROMA_PERSIST_DIRECTORY = os.getenv("CHROMA_PERSIST_DIRECTORY", "./chroma_db")
-        PAPER_DOWNLOAD_DIR = os.getenv("PAPER_DOWNLOAD_DIR", "./papers")
-    
-    CHROMA_COLLECTION_NAME = os.getenv("CHROMA_COLLECTION_NAME", "research_papers")
-    
+    HUGGINGFACE_MODEL_NAME: str = os.getenv("HUGGINGFACE_MODEL_NAME", "sentence-transformers/all-MiniLM-L6-v2")
+
+    # Vector Database
+    CHROMA_PERSIST_DIRECTORY: str = os.getenv("CHROMA_PERSIST_DIRECTORY", _DEFAULT_PERSIST_DIR)
+    PAPER_DOWNLOAD_DIR: str = os.getenv("PAPER_DOWNLOAD_DIR", _DEFAULT_DOWNLOAD_DIR)
+    CHROMA_COLLECTION_NAME: str = os.getenv("CHROMA_COLLECTION_NAME", "research_papers")
+
     # Paper Fetching
-    MAX_PAPERS_PER_QUERY = int(os.getenv("MAX_PAPERS_PER_QUERY", "10"))
-    
+    MAX_PAPERS_PER_QUERY: int = int(os.getenv("MAX_PAPERS_PER_QUERY", "10"))
+
     # API Settings
-    API_HOST = os.getenv("API_HOST", "0.0.0.0")
-    API_PORT = int(os.getenv("API_PORT", "8000"))
-    
+    API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
+    API_PORT: int = int(os.getenv("API_PORT", "8000"))
+
     # Chunking Settings
-    CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "1000"))
-    CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "200"))
-    
+    CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "1000"))
+    CHUNK_OVERLAP: int = int(os.getenv("CHUNK_OVERLAP", "200"))
+
     # Retrieval Settings
-    TOP_K_RETRIEVAL = int(os.getenv("TOP_K_RETRIEVAL", "5"))
-    SIMILARITY_THRESHOLD = float(os.getenv("SIMILARITY_THRESHOLD", "0.7"))
-    
-    @classmethod
-    def setup_for_colab(cls, openai_api_key=None):
+    TOP_K_RETRIEVAL: int = int(os.getenv("TOP_K_RETRIEVAL", "5"))
+    SIMILARITY_THRESHOLD: float = float(os.getenv("SIMILARITY_THRESHOLD", "0.7"))
+
+    # Semantic cache (query/answer near-hit lookup)
+    SIMILARITY_CACHE_THRESHOLD: float = float(os.getenv("SIMILARITY_CACHE_THRESHOLD", "0.95"))
+    SIMILARITY_CACHE_SIZE: int = int(os.getenv("SIMILARITY_CACHE_SIZE", "128"))
+
+    # Synthesis Settings
+    MIN_SYNTHESIS_SIMILARITY: float = float(os.getenv("MIN_SYNTHESIS_SIMILARITY", "0.15"))
+
+    def setup_for_colab(self, openai_api_key=None):
         """Helper function to setup ReSynth for Google Colab"""
         if os.path.exists("/content"):
             print("Setting up ReSynth for Google Colab...")
-            
+
             # Set environment variables for Colab
             os.environ["CHROMA_PERSIST_DIRECTORY"] = "/content/chroma_db"
             os.environ["PAPER_DOWNLOAD_DIR"] = "/content/papers"
-            
+
             if openai_api_key:
                 os.environ["OPENAI_API_KEY"] = openai_api_key
                 print("OpenAI API key set")
-            
+
             print("Colab configuration complete!")
             print(f"Database will be stored at: /content/chroma_db")
             print(f"Papers will be downloaded to: /content/papers")
         else:
             print("Not running in Google Colab")
-    
-    @classmethod
-    def validate(cls):
+
+    def validate(self):
         """Validate configuration"""
         issues = []
-        
-        if not cls.OPENAI_API_KEY:
+
+        if not self.OPENAI_API_KEY:
             issues.append("OpenAI API key not set (optional but recommended)")
-        
+
         try:
-            os.makedirs(cls.CHROMA_PERSIST_DIRECTORY, exist_ok=True)
-            os.makedirs(cls.PAPER_DOWNLOAD_DIR, exist_ok=True)
+            os.makedirs(self.CHROMA_PERSIST_DIRECTORY, exist_ok=True)
+            os.makedirs(self.PAPER_DOWNLOAD_DIR, exist_ok=True)
         except Exception as e:
             issues.append(f"Cannot create directories: {e}")
-        
+
+        self.setup_http_cache()
+
         return issues
+
+    def setup_http_cache(self):
+        """Install a transparent HTTP cache for all requests calls
+
+        Repeated arXiv/NCBI queries return from a local SQLite cache instead
+        of re-hitting the APIs, which also keeps us well under NCBI's rate
+        limit. E-utilities send no cache headers, so a fixed expiry is used.
+        """
+        try:
+            import requests_cache
+            requests_cache.install_cache(
+                cache_name=os.path.join(self.CHROMA_PERSIST_DIRECTORY, "http_cache"),
+                backend="sqlite",
+                expire_after=3600,
+                allowable_methods=("GET",)
+            )
+        except ImportError:
+            pass  # requests-cache is optional; fetchers work without it
+
+# Module-level singleton - call sites keep using Config.CHUNK_SIZE etc.
+Config = _Config()
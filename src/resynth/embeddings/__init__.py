@@ -4,5 +4,7 @@ Embedding and vector database modules
 
 from .embedding_manager import EmbeddingManager
 from .vector_store import VectorStore
+from .cache import EmbeddingCache
+from .faiss_store import FaissVectorStore
 
-__all__ = ['EmbeddingManager', 'VectorStore']
+__all__ = ['EmbeddingManager', 'VectorStore', 'EmbeddingCache', 'FaissVectorStore']
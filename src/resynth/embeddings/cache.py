@@ -0,0 +1,86 @@
+"""
+Persistent embedding cache
+"""
+
+import hashlib
+import os
+import shelve
+import numpy as np
+from functools import lru_cache
+from typing import List, Optional
+import logging
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=None)
+def _open_shelf(path: str):
+    """Shared shelf per cache file
+
+    dbm backends (gdbm in particular) allow only one writer per file, so
+    every cache instance in the process must reuse one open handle - the
+    same sharing pattern as the Chroma client and embedding manager.
+    """
+    return shelve.open(path)
+
+class EmbeddingCache:
+    """Disk-backed cache of text embeddings keyed by content hash
+
+    Embeddings are stored as fp16 bytes to halve the disk footprint; cache
+    hits skip the encoder entirely, so re-ingesting a paper costs a disk
+    lookup instead of a model forward pass. If the underlying store
+    cannot be opened (e.g. another process holds the writer lock), the
+    cache degrades to a no-op and every lookup is a miss.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, model_name: str = ""):
+        self.cache_dir = cache_dir or os.path.join(Config.CHROMA_PERSIST_DIRECTORY, "emb_cache")
+        self.model_name = model_name
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._shelf = _open_shelf(os.path.join(self.cache_dir, "embeddings"))
+            logger.info(f"Initialized embedding cache at '{self.cache_dir}'")
+        except Exception as e:
+            logger.warning(f"Could not open embedding cache ({e}); caching disabled")
+            self._shelf = None
+
+    def _key(self, text: str) -> str:
+        """Build the cache key for a text"""
+        return hashlib.sha256(f"{self.model_name}|{text}".encode("utf-8")).hexdigest()
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Get a cached embedding, or None on a cache miss"""
+        if self._shelf is None:
+            return None
+        try:
+            data = self._shelf.get(self._key(text))
+            if data is None:
+                return None
+            return np.frombuffer(data, dtype=np.float16).astype(np.float32)
+        except Exception as e:
+            logger.warning(f"Error reading from embedding cache: {e}")
+            return None
+
+    def put(self, text: str, embedding: List[float]) -> None:
+        """Store an embedding in the cache"""
+        if self._shelf is None:
+            return
+        try:
+            self._shelf[self._key(text)] = np.asarray(embedding, dtype=np.float16).tobytes()
+        except Exception as e:
+            logger.warning(f"Error writing to embedding cache: {e}")
+
+    def close(self) -> None:
+        """Flush pending writes
+
+        The shelf handle is shared across cache instances, so it is
+        synced rather than closed - closing here would break every other
+        VectorStore in the process.
+        """
+        if self._shelf is None:
+            return
+        try:
+            self._shelf.sync()
+        except Exception as e:
+            logger.warning(f"Error flushing embedding cache: {e}")
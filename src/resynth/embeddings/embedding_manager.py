@@ -3,6 +3,8 @@ Embedding generation and management
 """
 
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Union, Optional
 import logging
 from sentence_transformers import SentenceTransformer
@@ -11,6 +13,10 @@ from ..config import Config
 
 logger = logging.getLogger(__name__)
 
+# Concurrent in-flight OpenAI embedding requests; keep modest to stay
+# under default account rate limits
+_OPENAI_MAX_CONCURRENCY = 4
+
 class EmbeddingManager:
     """Manages text embedding generation"""
     
@@ -23,85 +29,134 @@ class EmbeddingManager:
             logger.info("Using OpenAI embeddings")
         else:
             try:
-                self.model = SentenceTransformer(self.model_name)
+                import torch
+
+                device = 'cuda' if torch.cuda.is_available() else None
+                self.model = SentenceTransformer(self.model_name, device=device)
+
+                if device == 'cuda':
+                    # Half precision halves memory bandwidth and engages
+                    # tensor cores on the compute-bound encoder pass
+                    self.model = self.model.half()
+                    try:
+                        self.model[0].auto_model = torch.compile(self.model[0].auto_model)
+                    except Exception as compile_error:
+                        logger.warning(f"torch.compile unavailable, running eager: {compile_error}")
+
                 logger.info(f"Loaded sentence transformer model: {self.model_name}")
             except Exception as e:
                 logger.error(f"Failed to load sentence transformer model: {e}")
                 raise
     
-    def embed_texts(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
-        """Generate embeddings for a list of texts"""
+    def embed_texts(self, texts: List[str], batch_size: int = 128) -> np.ndarray:
+        """Generate embeddings as a float32 (n, dim) array
+
+        Keeping the result as one ndarray end-to-end avoids boxing every
+        scalar into a Python float (~7x the memory of the raw buffer)
+        between the encoder and the vector store.
+        """
         if not texts:
-            return []
-        
+            return np.empty((0, 0), dtype=np.float32)
+
         # Filter out empty texts
         valid_texts = [text for text in texts if text and text.strip()]
         if not valid_texts:
-            return []
-        
+            return np.empty((0, 0), dtype=np.float32)
+
         try:
             if self.use_openai:
-                return self._embed_with_openai(valid_texts, batch_size)
+                embeddings = np.asarray(self._embed_with_openai(valid_texts, batch_size), dtype=np.float32)
+                # Unit-normalize so cosine similarity downstream is a bare
+                # dot product (ada-002 vectors are near-unit already, but
+                # failed-batch zero rows and rounding make this explicit)
+                norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+                return embeddings / np.clip(norms, 1e-12, None)
             else:
                 return self._embed_with_sentence_transformer(valid_texts, batch_size)
         except Exception as e:
             logger.error(f"Error generating embeddings: {e}")
-            return []
+            return np.empty((0, 0), dtype=np.float32)
     
     def _embed_with_openai(self, texts: List[str], batch_size: int) -> List[List[float]]:
-        """Generate embeddings using OpenAI API"""
-        embeddings = []
-        
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            
+        """Generate embeddings using OpenAI API
+
+        Texts are batched in length-sorted order so each request carries
+        near-uniform-size inputs (balanced token budgets per call) instead
+        of mixing short and long chunks; results are scattered back into
+        the original order. The sentence-transformer path gets the same
+        treatment for free - encode() length-sorts internally.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        batches = [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+
+        def embed_batch(batch_indices):
+            batch = [texts[j] for j in batch_indices]
             try:
                 response = openai.embeddings.create(
                     model="text-embedding-ada-002",
                     input=batch
                 )
-                
-                batch_embeddings = [item.embedding for item in response.data]
-                embeddings.extend(batch_embeddings)
-                
+                return batch_indices, [item.embedding for item in response.data]
             except Exception as e:
-                logger.error(f"Error in OpenAI embedding batch {i//batch_size}: {e}")
-                # Add zero embeddings for failed batch
-                embeddings.extend([[0.0] * 1536] * len(batch))
-        
+                logger.error(f"Error in OpenAI embedding batch: {e}")
+                # Zero rows for the failed batch - one array allocation
+                # instead of thousands of boxed Python floats
+                return batch_indices, np.zeros((len(batch_indices), 1536), dtype=np.float32)
+
+        # Issue batches concurrently - serial requests pay one network
+        # round-trip each, concurrent ones overlap into roughly one
+        if len(batches) == 1:
+            results = [embed_batch(batches[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(batches), _OPENAI_MAX_CONCURRENCY)) as executor:
+                results = list(executor.map(embed_batch, batches))
+
+        for batch_indices, batch_embeddings in results:
+            for j, embedding in zip(batch_indices, batch_embeddings):
+                embeddings[j] = embedding
+
         return embeddings
     
-    def _embed_with_sentence_transformer(self, texts: List[str], batch_size: int) -> List[List[float]]:
+    def _embed_with_sentence_transformer(self, texts: List[str], batch_size: int) -> np.ndarray:
         """Generate embeddings using sentence transformers"""
-        embeddings = []
-        
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            
-            try:
-                batch_embeddings = self.model.encode(
-                    batch,
-                    batch_size=batch_size,
-                    show_progress_bar=False,
-                    convert_to_numpy=True
-                )
-                embeddings.extend(batch_embeddings.tolist())
-                
-            except Exception as e:
-                logger.error(f"Error in sentence transformer batch {i//batch_size}: {e}")
-                # Add zero embeddings for failed batch
-                embedding_dim = self.model.get_sentence_embedding_dimension()
-                embeddings.extend([[0.0] * embedding_dim] * len(batch))
-        
-        return embeddings
+        try:
+            # Single encode call - sentence-transformers batches internally,
+            # amortizing the transformer forward pass across the whole list
+            # normalize_embeddings=True emits unit-L2 vectors from a fused
+            # kernel, so query-time cosine reduces to a dot product
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+            return np.asarray(embeddings, dtype=np.float32)
+
+        except Exception as e:
+            logger.error(f"Error in sentence transformer encoding: {e}")
+            # Return zero embeddings on failure
+            embedding_dim = self.model.get_sentence_embedding_dimension()
+            return np.zeros((len(texts), embedding_dim), dtype=np.float32)
     
+    @lru_cache(maxsize=2048)
+    def _embed_single_cached(self, text: str) -> tuple:
+        """Cached single-text embedding (tuple so entries stay immutable)"""
+        embeddings = self.embed_texts([text])
+        return tuple(map(float, embeddings[0])) if len(embeddings) else ()
+
     def embed_single_text(self, text: str) -> List[float]:
-        """Generate embedding for a single text"""
+        """Generate embedding for a single text
+
+        Repeated queries are common, and a short-text encode still runs
+        the full transformer (~tens of ms); the LRU collapses repeats to
+        a dict lookup.
+        """
         if not text or not text.strip():
             return []
-        
-        embeddings = self.embed_texts([text])
-        return embeddings[0] if embeddings else []
+
+        return list(self._embed_single_cached(text))
     
     def get_embedding_dimension(self) -> int:
         """Get the dimension of the embedding vectors"""
@@ -129,19 +184,51 @@ class EmbeddingManager:
         
         return dot_product / (norm1 * norm2)
     
-    def find_most_similar(self, query_embedding: List[float], 
-                         candidate_embeddings: List[List[float]], 
+    @staticmethod
+    def quantize_embeddings(embeddings) -> tuple:
+        """Quantize embeddings to int8 codes plus per-vector scales
+
+        Cuts candidate memory 4x versus float32 (28x versus Python float
+        lists); pass the (codes, scales) pair to find_most_similar in
+        place of the raw vectors. Cosine similarity is scale-invariant,
+        so the per-vector scales are only needed to reconstruct
+        magnitudes, not to rank.
+        """
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        scales = np.maximum(np.abs(vectors).max(axis=1) / 127.0, 1e-12)
+        codes = np.round(vectors / scales[:, None]).astype(np.int8)
+        return codes, scales.astype(np.float32)
+
+    def find_most_similar(self, query_embedding: List[float],
+                         candidate_embeddings,
                          top_k: int = 5) -> List[tuple]:
-        """Find most similar embeddings to query"""
-        if not query_embedding or not candidate_embeddings:
+        """Find most similar embeddings to query
+
+        All similarities come out of one matrix-vector product over a
+        stacked float32 candidate matrix (a single BLAS call) instead of
+        a Python loop of pairwise cosines, and only the top-k entries
+        are fully sorted via argpartition. candidate_embeddings may be
+        raw vectors or the (int8 codes, scales) pair produced by
+        quantize_embeddings.
+        """
+        if isinstance(candidate_embeddings, tuple):
+            candidate_embeddings = candidate_embeddings[0]
+        if not query_embedding or len(candidate_embeddings) == 0:
             return []
-        
-        similarities = []
-        for i, candidate_emb in enumerate(candidate_embeddings):
-            similarity = self.compute_similarity(query_embedding, candidate_emb)
-            similarities.append((i, similarity))
-        
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        
-        return similarities[:top_k]
+
+        candidates = np.ascontiguousarray(candidate_embeddings, dtype=np.float32)
+        query = np.asarray(query_embedding, dtype=np.float32)
+
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return []
+
+        norms = np.linalg.norm(candidates, axis=1)
+        similarities = (candidates @ query) / (norms.clip(min=1e-12) * query_norm)
+        similarities[norms == 0] = 0.0
+
+        top_k = min(top_k, len(similarities))
+        top_indices = np.argpartition(-similarities, top_k - 1)[:top_k]
+        top_indices = top_indices[np.argsort(-similarities[top_indices])]
+
+        return [(int(i), float(similarities[i])) for i in top_indices]
@@ -0,0 +1,198 @@
+"""
+Optional FAISS-backed vector store for large collections
+"""
+
+import json
+import os
+import sqlite3
+from typing import List, Dict, Any, Optional
+import logging
+
+import numpy as np
+
+# faiss is an optional dependency - the default Chroma store covers
+# typical collection sizes, this tier exists for multi-million-vector
+# corpora that do not fit an uncompressed HNSW graph in RAM
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+from ..processors.chunker import Chunk, ChunkBatch
+from .embedding_manager import EmbeddingManager
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+class FaissVectorStore:
+    """Vector store backed by a FAISS IVFPQ index
+
+    Mirrors the VectorStore interface (add_chunks/search/clear_collection/
+    get_collection_stats) but compresses each vector to product-quantized
+    codes (~m bytes instead of 4*dim), so collections far beyond Chroma's
+    comfortable in-RAM size stay searchable. Chunk text and metadata live
+    in a sidecar SQLite table keyed by the FAISS int64 id.
+    """
+
+    def __init__(self, persist_directory: Optional[str] = None,
+                 nlist: int = 1024, m: int = 8, nbits: int = 8, nprobe: int = 16):
+        if faiss is None:
+            raise ImportError(
+                "faiss is required for FaissVectorStore - install faiss-cpu "
+                "or use the default Chroma-backed VectorStore"
+            )
+
+        self.persist_directory = persist_directory or Config.CHROMA_PERSIST_DIRECTORY
+        os.makedirs(self.persist_directory, exist_ok=True)
+        self.index_path = os.path.join(self.persist_directory, "faiss.index")
+        self.metadata_path = os.path.join(self.persist_directory, "faiss_meta.db")
+
+        self.nlist = nlist
+        self.m = m
+        self.nbits = nbits
+        self.nprobe = nprobe
+
+        self.embedding_manager = EmbeddingManager()
+        self.dimension = self.embedding_manager.get_embedding_dimension()
+
+        self._db = sqlite3.connect(self.metadata_path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS chunks ("
+            "id INTEGER PRIMARY KEY, chunk_id TEXT, text TEXT, metadata TEXT)"
+        )
+        self._db.commit()
+
+        if os.path.exists(self.index_path):
+            self.index = faiss.read_index(self.index_path)
+        else:
+            quantizer = faiss.IndexFlatL2(self.dimension)
+            self.index = faiss.IndexIVFPQ(quantizer, self.dimension, nlist, m, nbits)
+
+        logger.info(f"Initialized FAISS vector store at {self.index_path}")
+
+    def _next_id(self) -> int:
+        row = self._db.execute("SELECT COALESCE(MAX(id), -1) FROM chunks").fetchone()
+        return row[0] + 1
+
+    def add_chunks(self, chunks) -> bool:
+        """Add a ChunkBatch (or list of Chunks) to the index"""
+        if not chunks:
+            return False
+
+        try:
+            batch = chunks if isinstance(chunks, ChunkBatch) else ChunkBatch.from_chunks(chunks)
+
+            embeddings = self.embedding_manager.embed_texts(batch.texts)
+            if len(embeddings) != len(batch):
+                logger.error("Embedding generation failed - mismatch in lengths")
+                return False
+
+            vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+            # IVFPQ must be trained on representative vectors before adds;
+            # train lazily on the first sufficiently large batch
+            if not self.index.is_trained:
+                if len(vectors) < self.nlist:
+                    logger.warning(
+                        f"Training IVFPQ on only {len(vectors)} vectors "
+                        f"(fewer than nlist={self.nlist}); recall may suffer"
+                    )
+                self.index.train(vectors)
+
+            start_id = self._next_id()
+            ids = np.arange(start_id, start_id + len(vectors), dtype=np.int64)
+            self.index.add_with_ids(vectors, ids)
+
+            self._db.executemany(
+                "INSERT INTO chunks (id, chunk_id, text, metadata) VALUES (?, ?, ?, ?)",
+                [
+                    (int(i), chunk_id, text, json.dumps(metadata, default=str))
+                    for i, chunk_id, text, metadata
+                    in zip(ids, batch.chunk_ids, batch.texts, batch.metadatas)
+                ]
+            )
+            self._db.commit()
+
+            faiss.write_index(self.index, self.index_path)
+            logger.info(f"Added {len(vectors)} chunks to FAISS index")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error adding chunks to FAISS index: {e}")
+            return False
+
+    def search(self, query: str, top_k: int = 5, similarity_threshold: float = 0.7,
+               query_embedding: Optional[List[float]] = None) -> List[Dict[str, Any]]:
+        """Search for similar chunks"""
+        if not query or self.index.ntotal == 0:
+            return []
+
+        try:
+            if query_embedding is None:
+                query_embedding = self.embedding_manager.embed_single_text(query)
+            if not query_embedding:
+                return []
+
+            vector = np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
+            self.index.nprobe = self.nprobe
+            distances, ids = self.index.search(vector, top_k)
+
+            search_results = []
+            for distance, chunk_row_id in zip(distances[0], ids[0]):
+                if chunk_row_id < 0:
+                    continue
+
+                # L2 distance on unit-norm-ish vectors maps to cosine via
+                # sim = 1 - d^2 / 2; keeps parity with the Chroma scores
+                similarity = 1.0 - float(distance) / 2.0
+                if similarity < similarity_threshold:
+                    continue
+
+                row = self._db.execute(
+                    "SELECT chunk_id, text, metadata FROM chunks WHERE id = ?",
+                    (int(chunk_row_id),)
+                ).fetchone()
+                if row is None:
+                    continue
+
+                search_results.append({
+                    'chunk_id': row[0],
+                    'text': row[1],
+                    'metadata': json.loads(row[2]),
+                    'similarity': similarity,
+                    'distance': float(distance)
+                })
+
+            return search_results
+
+        except Exception as e:
+            logger.error(f"Error searching FAISS index: {e}")
+            return []
+
+    def clear_collection(self) -> bool:
+        """Clear all chunks from the index"""
+        try:
+            quantizer = faiss.IndexFlatL2(self.dimension)
+            self.index = faiss.IndexIVFPQ(quantizer, self.dimension, self.nlist, self.m, self.nbits)
+            self._db.execute("DELETE FROM chunks")
+            self._db.commit()
+            if os.path.exists(self.index_path):
+                os.remove(self.index_path)
+            logger.info("Cleared FAISS index")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error clearing FAISS index: {e}")
+            return False
+
+    def get_collection_stats(self) -> Dict[str, Any]:
+        """Get statistics about the index"""
+        try:
+            return {
+                'collection_name': 'faiss_ivfpq',
+                'total_chunks': int(self.index.ntotal),
+                'persist_directory': self.persist_directory
+            }
+        except Exception as e:
+            logger.error(f"Error getting FAISS stats: {e}")
+            return {}
@@ -4,87 +4,171 @@ Vector database management using ChromaDB
 
 import chromadb
 from chromadb.config import Settings
+import numpy as np
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 import logging
-from ..processors.chunker import Chunk
+from ..processors.chunker import Chunk, ChunkBatch
 from .embedding_manager import EmbeddingManager
+from .cache import EmbeddingCache
 from ..config import Config
 
 logger = logging.getLogger(__name__)
 
+# HNSW parameters for the Chroma collection: higher construction_ef/M build
+# a denser graph for better recall, search_ef covers top_k up to ~20
+_COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+    "hnsw:M": 32
+}
+
+# Chunks written to Chroma per upsert call; large ingests are sliced to
+# stay under Chroma's per-call batch limit
+_MAX_WRITE_BATCH = 1000
+
+@lru_cache(maxsize=None)
+def _get_client(persist_directory: str) -> chromadb.PersistentClient:
+    """Shared Chroma client per persist directory"""
+    return chromadb.PersistentClient(
+        path=persist_directory,
+        settings=Settings(anonymized_telemetry=False)
+    )
+
+@lru_cache(maxsize=None)
+def _get_embedding_manager(model_name: Optional[str], use_openai: bool) -> EmbeddingManager:
+    """Shared embedding manager - the model loads once per process"""
+    return EmbeddingManager(model_name=model_name, use_openai=use_openai)
+
 class VectorStore:
-    """Manages vector storage and retrieval using ChromaDB"""
-    
+    """Manages vector storage and retrieval using ChromaDB
+
+    The Chroma client and the embedding manager are shared across
+    instances (keyed by persist directory and model), so constructing a
+    second VectorStore neither spawns another client nor loads another
+    copy of the sentence-transformer weights.
+    """
+
     def __init__(self, collection_name: Optional[str] = None, persist_directory: Optional[str] = None):
         self.collection_name = collection_name or Config.CHROMA_COLLECTION_NAME
         self.persist_directory = persist_directory or Config.CHROMA_PERSIST_DIRECTORY
-        
-        # Initialize ChromaDB client
-        self.client = chromadb.PersistentClient(path=self.persist_directory)
-        
-        # Initialize embedding manager
-        self.embedding_manager = EmbeddingManager()
+
+        # Initialize ChromaDB client (shared per persist directory)
+        self.client = _get_client(self.persist_directory)
+
+        # Initialize embedding manager (shared) and persistent embedding cache
+        self.embedding_manager = _get_embedding_manager(None, False)
+        self.embedding_cache = EmbeddingCache(model_name=self.embedding_manager.model_name)
         
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
             name=self.collection_name,
-            metadata={"hnsw:space": "cosine"}
+            metadata=_COLLECTION_METADATA
         )
+
+        # Paper titles are cached and maintained incrementally so listing
+        # papers does not scan every metadata blob; None means cold
+        self._paper_titles: Optional[set] = None
+
+        # Bumped on every successful mutation; consumers that cache
+        # results derived from the collection (the retriever's query
+        # cache) compare against this to know their entries are stale
+        self.data_version = 0
         
         logger.info(f"Initialized vector store with collection '{self.collection_name}'")
     
-    def add_chunks(self, chunks: List[Chunk]) -> bool:
-        """Add chunks to the vector store"""
+    def add_chunks(self, chunks) -> bool:
+        """Add a ChunkBatch (or list of Chunks) to the vector store"""
         if not chunks:
             return False
-        
+
         try:
-            # Prepare data for batch insertion
-            ids = [chunk.chunk_id for chunk in chunks]
-            texts = [chunk.text for chunk in chunks]
-            metadatas = []
-            
-            for chunk in chunks:
-                metadata = chunk.metadata.copy() if chunk.metadata else {}
-                metadata.update({
-                    'paper_title': chunk.paper_title,
-                    'paper_url': chunk.paper_url,
-                    'paper_authors': chunk.paper_authors,
-                    'start_char': chunk.start_char,
-                    'end_char': chunk.end_char
-                })
-                metadatas.append(metadata)
-            
-            # Generate embeddings
-            embeddings = self.embedding_manager.embed_texts(texts)
-            
-            if len(embeddings) != len(chunks):
-                logger.error("Embedding generation failed - mismatch in lengths")
-                return False
-            
-            # Add to collection
-            self.collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                documents=texts,
-                metadatas=metadatas
-            )
+            # The chunker emits column-oriented batches; convert plain
+            # chunk lists for callers that still build them
+            batch = chunks if isinstance(chunks, ChunkBatch) else ChunkBatch.from_chunks(chunks)
+            ids = batch.chunk_ids
+            texts = batch.texts
+            metadatas = batch.metadatas
+
+            # Drop chunks already indexed - re-processing a paper should
+            # neither re-embed nor duplicate HNSW inserts
+            existing = set(self.collection.get(ids=ids, include=[])['ids'])
+            if existing:
+                keep = [i for i, chunk_id in enumerate(ids) if chunk_id not in existing]
+                logger.info(f"Skipping {len(ids) - len(keep)} chunks already in the collection")
+                if not keep:
+                    return True
+                ids = [ids[i] for i in keep]
+                texts = [texts[i] for i in keep]
+                metadatas = [metadatas[i] for i in keep]
+
+            # Generate embeddings, reusing cached vectors for texts seen before
+            embeddings = [self.embedding_cache.get(text) for text in texts]
+            miss_indices = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+            if miss_indices:
+                miss_texts = [texts[i] for i in miss_indices]
+                new_embeddings = self.embedding_manager.embed_texts(miss_texts)
+
+                if len(new_embeddings) != len(miss_texts):
+                    logger.error("Embedding generation failed - mismatch in lengths")
+                    return False
+
+                for i, embedding in zip(miss_indices, new_embeddings):
+                    embeddings[i] = embedding
+                    self.embedding_cache.put(texts[i], embedding)
+
+            logger.info(f"Embedded {len(miss_indices)} chunks "
+                        f"({len(texts) - len(miss_indices)} cache hits)")
+
+            # Quantize to fp16 - recall impact for cosine search at 384
+            # dims is negligible - but hand Chroma plain lists of floats:
+            # the pinned chromadb rejects ndarrays in validate_embeddings
+            embeddings = np.asarray(embeddings, dtype=np.float16).astype(np.float32).tolist()
+
+            # Upsert in as few calls as possible - one write transaction
+            # per slice instead of one per chunk. upsert (rather than add)
+            # keeps re-ingesting a paper idempotent even if the id
+            # pre-filter races another writer, and the slice cap stays
+            # under Chroma's per-call batch limit
+            for start in range(0, len(ids), _MAX_WRITE_BATCH):
+                end = start + _MAX_WRITE_BATCH
+                self.collection.upsert(
+                    ids=ids[start:end],
+                    embeddings=embeddings[start:end],
+                    documents=texts[start:end],
+                    metadatas=metadatas[start:end]
+                )
             
-            logger.info(f"Successfully added {len(chunks)} chunks to vector store")
+            if self._paper_titles is not None:
+                self._paper_titles.update(
+                    metadata['paper_title'] for metadata in metadatas
+                    if metadata.get('paper_title')
+                )
+
+            self.data_version += 1
+            logger.info(f"Successfully added {len(ids)} chunks to vector store")
             return True
             
         except Exception as e:
             logger.error(f"Error adding chunks to vector store: {e}")
             return False
     
-    def search(self, query: str, top_k: int = 5, similarity_threshold: float = 0.7) -> List[Dict[str, Any]]:
-        """Search for similar chunks"""
+    def search(self, query: str, top_k: int = 5, similarity_threshold: float = 0.7,
+               query_embedding: Optional[List[float]] = None) -> List[Dict[str, Any]]:
+        """Search for similar chunks
+
+        Callers that already hold the query embedding (e.g. the retriever's
+        query cache) can pass it in to avoid embedding the query twice.
+        """
         if not query:
             return []
-        
+
         try:
-            # Generate query embedding
-            query_embedding = self.embedding_manager.embed_single_text(query)
+            # Generate query embedding unless the caller supplied one
+            if query_embedding is None:
+                query_embedding = self.embedding_manager.embed_single_text(query)
             if not query_embedding:
                 return []
             
@@ -94,32 +178,71 @@ class VectorStore:
                 n_results=top_k,
                 include=['documents', 'metadatas', 'distances']
             )
-            
-            # Process results
-            search_results = []
-            if results['documents'] and results['documents'][0]:
-                for i, (doc, metadata, distance) in enumerate(zip(
-                    results['documents'][0],
-                    results['metadatas'][0],
-                    results['distances'][0]
-                )):
-                    # Convert distance to similarity (cosine distance to cosine similarity)
-                    similarity = 1 - distance
-                    
-                    if similarity >= similarity_threshold:
-                        search_results.append({
-                            'chunk_id': metadata.get('chunk_id', f'chunk_{i}'),
-                            'text': doc,
-                            'metadata': metadata,
-                            'similarity': similarity,
-                            'distance': distance
-                        })
-            
-            return search_results
-            
+
+            return self._format_query_results(results, 0, similarity_threshold)
+
         except Exception as e:
             logger.error(f"Error searching vector store: {e}")
             return []
+
+    def search_batch(self, queries: List[str], top_k: int = 5,
+                     similarity_threshold: float = 0.7) -> List[List[Dict[str, Any]]]:
+        """Search several queries with one embed and one index call
+
+        All queries go through a single batched encode and a single
+        multi-query Chroma call, so N expanded queries cost one model
+        forward pass instead of N. Returns one result list per query,
+        in the same order.
+        """
+        if not queries:
+            return []
+
+        try:
+            embeddings = self.embedding_manager.embed_texts(list(queries))
+            if len(embeddings) != len(queries):
+                logger.error("Batch query embedding failed - mismatch in lengths")
+                return [[] for _ in queries]
+
+            # Chroma's embedding validation only accepts lists of floats
+            results = self.collection.query(
+                query_embeddings=np.asarray(embeddings, dtype=np.float32).tolist(),
+                n_results=top_k,
+                include=['documents', 'metadatas', 'distances']
+            )
+
+            return [
+                self._format_query_results(results, i, similarity_threshold)
+                for i in range(len(queries))
+            ]
+
+        except Exception as e:
+            logger.error(f"Error batch-searching vector store: {e}")
+            return [[] for _ in queries]
+
+    @staticmethod
+    def _format_query_results(results, query_index: int,
+                              similarity_threshold: float) -> List[Dict[str, Any]]:
+        """Convert one query's slice of a Chroma response to result dicts"""
+        search_results = []
+        if results['documents'] and results['documents'][query_index]:
+            for i, (doc, metadata, distance) in enumerate(zip(
+                results['documents'][query_index],
+                results['metadatas'][query_index],
+                results['distances'][query_index]
+            )):
+                # Convert distance to similarity (cosine distance to cosine similarity)
+                similarity = 1 - distance
+
+                if similarity >= similarity_threshold:
+                    search_results.append({
+                        'chunk_id': metadata.get('chunk_id', f'chunk_{i}'),
+                        'text': doc,
+                        'metadata': metadata,
+                        'similarity': similarity,
+                        'distance': distance
+                    })
+
+        return search_results
     
     def get_chunk_by_id(self, chunk_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific chunk by ID"""
@@ -142,6 +265,36 @@ class VectorStore:
             logger.error(f"Error getting chunk by ID {chunk_id}: {e}")
             return None
     
+    def get_chunks_by_metadata(self, field: str, value: Any,
+                               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Fetch chunks whose metadata field equals a value
+
+        Goes through the collection's metadata filter rather than an ANN
+        search, so looking up a paper's chunks is an indexed get instead
+        of embedding the title and hoping its chunks rank in the top-k.
+        """
+        try:
+            results = self.collection.get(
+                where={field: value},
+                limit=limit,
+                include=['documents', 'metadatas']
+            )
+
+            chunks = []
+            for chunk_id, doc, metadata in zip(
+                results['ids'], results['documents'], results['metadatas']
+            ):
+                chunks.append({
+                    'chunk_id': metadata.get('chunk_id', chunk_id),
+                    'text': doc,
+                    'metadata': metadata
+                })
+            return chunks
+
+        except Exception as e:
+            logger.error(f"Error fetching chunks by metadata {field}={value}: {e}")
+            return []
+
     def delete_chunks(self, chunk_ids: List[str]) -> bool:
         """Delete chunks from the vector store"""
         if not chunk_ids:
@@ -149,6 +302,9 @@ class VectorStore:
         
         try:
             self.collection.delete(ids=chunk_ids)
+            # Deleted chunks may have been a paper's last - rebuild lazily
+            self._paper_titles = None
+            self.data_version += 1
             logger.info(f"Deleted {len(chunk_ids)} chunks from vector store")
             return True
             
@@ -159,18 +315,31 @@ class VectorStore:
     def clear_collection(self) -> bool:
         """Clear all chunks from the collection"""
         try:
-            # Delete the collection and recreate it
-            self.client.delete_collection(name=self.collection_name)
-            self.collection = self.client.get_or_create_collection(
-                name=self.collection_name,
-                metadata={"hnsw:space": "cosine"}
-            )
+            # Delete by id rather than dropping the collection - keeps the
+            # existing handle and HNSW settings instead of rebuilding both
+            ids = self.collection.get(include=[])['ids']
+            if ids:
+                self.collection.delete(ids=ids)
+            self._paper_titles = set()
+            self.data_version += 1
             logger.info(f"Cleared collection '{self.collection_name}'")
             return True
-            
+
         except Exception as e:
-            logger.error(f"Error clearing collection: {e}")
-            return False
+            logger.error(f"Error clearing collection by ids, recreating: {e}")
+            try:
+                # Fallback: drop and recreate from scratch
+                self.client.delete_collection(name=self.collection_name)
+                self.collection = self.client.get_or_create_collection(
+                    name=self.collection_name,
+                    metadata=_COLLECTION_METADATA
+                )
+                self._paper_titles = set()
+                self.data_version += 1
+                return True
+            except Exception as recreate_error:
+                logger.error(f"Error clearing collection: {recreate_error}")
+                return False
     
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get statistics about the collection"""
@@ -187,22 +356,35 @@ class VectorStore:
     
     def get_papers_in_collection(self) -> List[str]:
         """Get list of unique paper titles in the collection"""
+        if self._paper_titles is not None:
+            return list(self._paper_titles)
+
         try:
-            # Get all metadata
-            results = self.collection.get(include=['metadatas'])
-            
-            if not results['metadatas']:
-                return []
-            
-            # Extract unique paper titles
+            # Cold start: paginate the metadata scan so peak memory is one
+            # page, not the whole collection; afterwards the set is
+            # maintained incrementally by add/delete/clear
             paper_titles = set()
-            for metadata in results['metadatas']:
-                title = metadata.get('paper_title')
-                if title:
-                    paper_titles.add(title)
-            
+            offset = 0
+            page_size = 10_000
+
+            while True:
+                results = self.collection.get(
+                    include=['metadatas'], limit=page_size, offset=offset
+                )
+                metadatas = results['metadatas'] or []
+                if not metadatas:
+                    break
+                paper_titles.update(
+                    metadata['paper_title'] for metadata in metadatas
+                    if metadata.get('paper_title')
+                )
+                if len(metadatas) < page_size:
+                    break
+                offset += page_size
+
+            self._paper_titles = paper_titles
             return list(paper_titles)
-            
+
         except Exception as e:
             logger.error(f"Error getting papers in collection: {e}")
             return []
@@ -6,11 +6,19 @@ import arxiv
 import requests
 import PyPDF2
 import io
+import shutil
 from typing import List, Optional
 from datetime import datetime
 import logging
 
-from .base_fetcher import BaseFetcher, Paper
+# pypdfium2 (native PDFium bindings) extracts text several times faster
+# than PyPDF2; fall back to PyPDF2 when it is not installed
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+from .base_fetcher import BaseFetcher, Paper, cached_search
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +29,7 @@ class ArxivFetcher(BaseFetcher):
         super().__init__(max_results)
         self.base_url = "http://export.arxiv.org/api/query"
     
+    @cached_search
     def search(self, query: str, **kwargs) -> List[Paper]:
         """Search arXiv for papers"""
         try:
@@ -58,24 +67,47 @@ class ArxivFetcher(BaseFetcher):
             return ""
         
         try:
-            response = requests.get(paper.pdf_url, timeout=30)
-            response.raise_for_status()
-            
-            # Extract text from PDF
-            pdf_file = io.BytesIO(response.content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text_content = []
-            for page in pdf_reader.pages:
-                text = page.extract_text()
-                if text:
-                    text_content.append(text)
-            
-            return "\n".join(text_content)
-            
+            # Stream the response body straight into one buffer instead of
+            # materializing response.content and then copying it again
+            with self.session.get(paper.pdf_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                pdf_file = io.BytesIO()
+                shutil.copyfileobj(response.raw, pdf_file, length=64 * 1024)
+
+            pdf_file.seek(0)
+            return self._extract_pdf_text(pdf_file)
+
         except Exception as e:
             logger.error(f"Error fetching paper content for {paper.title}: {e}")
             return ""
+
+    def _extract_pdf_text(self, pdf_file: io.BytesIO) -> str:
+        """Extract text from a PDF file-like object"""
+        if pdfium is not None:
+            pdf = pdfium.PdfDocument(pdf_file)
+            try:
+                text_content = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    text = textpage.get_text_bounded()
+                    if text:
+                        text_content.append(text)
+                    textpage.close()
+                    page.close()
+                return "\n".join(text_content)
+            finally:
+                pdf.close()
+
+        # Fallback: pure-Python PyPDF2
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+
+        text_content = []
+        for page in pdf_reader.pages:
+            text = page.extract_text()
+            if text:
+                text_content.append(text)
+
+        return "\n".join(text_content)
     
     def get_paper_by_id(self, arxiv_id: str) -> Optional[Paper]:
         """Get a specific paper by arXiv ID"""
@@ -2,11 +2,90 @@
 Base class for paper fetchers
 """
 
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache, wraps
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+@lru_cache(maxsize=1)
+def get_shared_session() -> requests.Session:
+    """Shared keep-alive session used by all fetchers
+
+    Connection pooling reuses TCP/TLS connections across papers instead of
+    paying the handshake round-trips on every fetch, and transient server
+    errors are retried with backoff instead of failing the whole paper.
+    When requests-cache is installed (see Config.setup_http_cache) this
+    session is transparently cache-backed as well.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+class _SearchCache:
+    """Small TTL+LRU cache for search results
+
+    The common UI flow searches a query and then immediately processes
+    the same query, which used to hit the arXiv/PubMed APIs twice.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created, value = entry
+        if time.monotonic() - created > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+_search_cache = _SearchCache()
+
+def cached_search(func):
+    """Cache a fetcher's search results for a short TTL
+
+    Keyed on the fetcher class, query, and max_results so repeated
+    search-then-process flows reuse the first API round-trip.
+    """
+    @wraps(func)
+    def wrapper(self, query: str, **kwargs):
+        if kwargs:
+            return func(self, query, **kwargs)
+        key = (type(self).__name__, query, self.max_results)
+        cached = _search_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        results = func(self, query)
+        if results:
+            _search_cache.put(key, results)
+        return list(results)
+    return wrapper
+
 @dataclass
 class Paper:
     """Represents a research paper"""
@@ -32,6 +111,7 @@ class BaseFetcher(ABC):
     
     def __init__(self, max_results: int = 10):
         self.max_results = max_results
+        self.session = get_shared_session()
     
     @abstractmethod
     def search(self, query: str, **kwargs) -> List[Paper]:
@@ -2,7 +2,24 @@
 Text processing and chunking modules
 """
 
-from .text_processor import TextProcessor
-from .chunker import SemanticChunker
+import importlib
 
-__all__ = ['TextProcessor', 'SemanticChunker']
+# Lazy attribute loading (PEP 562), mirroring the top-level package:
+# TextProcessor users should not pay the chunker's import cost (and
+# vice versa) until the class is actually touched
+_LAZY_IMPORTS = {
+    'TextProcessor': '.text_processor',
+    'SemanticChunker': '.chunker',
+    'Chunk': '.chunker',
+    'ChunkBatch': '.chunker',
+}
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = attr
+    return attr
+
+__all__ = ['TextProcessor', 'SemanticChunker', 'Chunk', 'ChunkBatch']
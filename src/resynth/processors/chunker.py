@@ -2,8 +2,11 @@
 Text chunking utilities
 """
 
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from dataclasses import dataclass, field
 import logging
 from .text_processor import TextProcessor
 
@@ -25,6 +28,46 @@ class Chunk:
         if self.metadata is None:
             self.metadata = {}
 
+@dataclass
+class ChunkBatch:
+    """Column-oriented batch of chunks ready for embedding
+
+    Stores parallel arrays instead of one object per chunk so the texts
+    column can go straight into a batched encoder and into the vector
+    store without a per-chunk gather pass.
+    """
+    texts: List[str] = field(default_factory=list)
+    chunk_ids: List[str] = field(default_factory=list)
+    metadatas: List[Dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __bool__(self) -> bool:
+        return bool(self.texts)
+
+    def append(self, chunk: Chunk):
+        """Append one Chunk's columns to the batch"""
+        metadata = chunk.metadata.copy() if chunk.metadata else {}
+        metadata.update({
+            'paper_title': chunk.paper_title,
+            'paper_url': chunk.paper_url,
+            'paper_authors': chunk.paper_authors,
+            'start_char': chunk.start_char,
+            'end_char': chunk.end_char
+        })
+        self.texts.append(chunk.text)
+        self.chunk_ids.append(chunk.chunk_id)
+        self.metadatas.append(metadata)
+
+    @classmethod
+    def from_chunks(cls, chunks: List[Chunk]) -> 'ChunkBatch':
+        """Build a batch from a list of Chunk objects"""
+        batch = cls()
+        for chunk in chunks:
+            batch.append(chunk)
+        return batch
+
 class SemanticChunker:
     """Intelligent text chunking based on semantic boundaries"""
     
@@ -33,8 +76,13 @@ class SemanticChunker:
         self.chunk_overlap = chunk_overlap
         self.text_processor = TextProcessor()
     
-    def chunk_paper(self, paper) -> List[Chunk]:
-        """Chunk a paper into semantic segments"""
+    def chunk_paper(self, paper) -> Iterator[Chunk]:
+        """Chunk a paper into semantic segments, yielding chunks lazily
+
+        Yielding instead of materializing a list keeps peak memory at
+        O(one chunk) on top of the paper text, so downstream consumers
+        can embed in bounded batches while iterating.
+        """
         # Preprocess the paper content
         full_text = self.text_processor.preprocess_paper_content(
             paper.title, 
@@ -47,69 +95,96 @@ class SemanticChunker:
         
         if not paragraphs:
             # Fallback to simple chunking
-            return self._simple_chunk(full_text, paper)
-        
-        # Create chunks based on paragraphs
-        chunks = []
-        current_chunk = ""
-        chunk_start = 0
-        
-        for i, paragraph in enumerate(paragraphs):
-            # Check if adding this paragraph exceeds chunk size
-            if len(current_chunk) + len(paragraph) + 2 <= self.chunk_size:
-                if current_chunk:
-                    current_chunk += "\n\n" + paragraph
-                else:
-                    current_chunk = paragraph
-            else:
-                # Save current chunk if it exists
-                if current_chunk.strip():
-                    chunk = self._create_chunk(
-                        current_chunk, 
-                        paper, 
-                        chunk_start, 
-                        chunk_start + len(current_chunk)
-                    )
-                    chunks.append(chunk)
-                
-                # Start new chunk with overlap
-                if self.chunk_overlap > 0 and len(current_chunk) > self.chunk_overlap:
-                    overlap_text = current_chunk[-self.chunk_overlap:]
-                    current_chunk = overlap_text + "\n\n" + paragraph
-                    chunk_start = chunk_start + len(current_chunk) - len(overlap_text)
-                else:
-                    current_chunk = paragraph
-                    chunk_start = chunk_start + len(current_chunk)
-        
-        # Add the last chunk
-        if current_chunk.strip():
-            chunk = self._create_chunk(
-                current_chunk, 
-                paper, 
-                chunk_start, 
-                chunk_start + len(current_chunk)
-            )
-            chunks.append(chunk)
+            yield from self._simple_chunk(full_text, paper)
+            return
         
-        return chunks
-    
-    def _simple_chunk(self, text: str, paper) -> List[Chunk]:
+        # Phase 1: plan chunk boundaries over the paragraph lengths alone -
+        # the hot loop is pure integer arithmetic with no string building
+        lengths = np.fromiter((len(p) for p in paragraphs), dtype=np.int32, count=len(paragraphs))
+        plan = self._plan_chunks(lengths)
+
+        # Character offset of each paragraph in the joined document
+        # (+2 accounts for the "\n\n" separators)
+        offsets = np.zeros(len(paragraphs) + 1, dtype=np.int64)
+        np.cumsum(lengths + 2, out=offsets[1:])
+
+        # Phase 2: materialize each planned chunk with a single join
+        for start_idx, end_idx in plan:
+            text = "\n\n".join(paragraphs[start_idx:end_idx])
+            if text.strip():
+                start_char = int(offsets[start_idx])
+                yield self._create_chunk(text, paper, start_char, start_char + len(text))
+
+    def _plan_chunks(self, lengths: np.ndarray) -> List[Tuple[int, int]]:
+        """Plan chunk boundaries as (start_para, end_para) index pairs
+
+        Windows accumulate whole paragraphs up to chunk_size; on flush the
+        next window starts with the trailing paragraphs that fit inside
+        chunk_overlap, so overlap falls on paragraph boundaries. A paragraph
+        longer than chunk_size is emitted as its own chunk.
+        """
+        plan = []
+        n = len(lengths)
+        start = 0
+        current_len = 0
+        i = 0
+        last_end = 0
+
+        while i < n:
+            paragraph_len = int(lengths[i])
+            added = paragraph_len if current_len == 0 else paragraph_len + 2
+
+            if current_len == 0 or current_len + added <= self.chunk_size:
+                current_len += added
+                i += 1
+                continue
+
+            if i == last_end:
+                # The window holds nothing but the previous chunk's
+                # overlap and the next paragraph does not fit beside it;
+                # flushing here would emit a chunk fully contained in the
+                # one just flushed. Drop the overlap and start fresh.
+                start = i
+                current_len = 0
+                continue
+
+            plan.append((start, i))
+            last_end = i
+
+            # Walk back whole paragraphs to form the overlap of the next window
+            prev_start = start
+            j = i
+            overlap_len = 0
+            while j > start and overlap_len + int(lengths[j - 1]) + 2 <= self.chunk_overlap:
+                j -= 1
+                overlap_len += int(lengths[j]) + 2
+
+            start = j
+            current_len = overlap_len
+
+            if start == prev_start:
+                # Overlap would swallow the whole window - drop it to
+                # guarantee forward progress
+                start = i
+                current_len = 0
+
+        if current_len > 0 and n > last_end:
+            plan.append((start, n))
+
+        return plan
+
+    def _simple_chunk(self, text: str, paper) -> Iterator[Chunk]:
         """Simple character-based chunking as fallback"""
-        chunks = []
-        
         for i in range(0, len(text), self.chunk_size - self.chunk_overlap):
             chunk_text = text[i:i + self.chunk_size]
-            
+
             if chunk_text.strip():
-                chunk = self._create_chunk(
-                    chunk_text, 
-                    paper, 
-                    i, 
+                yield self._create_chunk(
+                    chunk_text,
+                    paper,
+                    i,
                     i + len(chunk_text)
                 )
-                chunks.append(chunk)
-        
-        return chunks
     
     def _create_chunk(self, text: str, paper, start_char: int, end_char: int) -> Chunk:
         """Create a chunk object"""
@@ -139,19 +214,42 @@ class SemanticChunker:
             metadata=metadata
         )
     
-    def chunk_multiple_papers(self, papers: List) -> List[Chunk]:
-        """Chunk multiple papers"""
-        all_chunks = []
-        
+    # Chunking below this many papers runs sequentially - worker startup
+    # costs more than the chunking itself
+    _PARALLEL_MIN_PAPERS = 4
+
+    def chunk_multiple_papers(self, papers: List) -> ChunkBatch:
+        """Chunk multiple papers into one embedding-ready batch
+
+        Per-paper chunking is CPU-bound pure-Python/regex work that never
+        releases the GIL, so larger batches are distributed across a
+        process pool (one chunker per worker process); small batches stay
+        sequential to avoid the pool startup cost.
+        """
+        batch = ChunkBatch()
+
+        if len(papers) >= self._PARALLEL_MIN_PAPERS:
+            try:
+                max_workers = min(len(papers), os.cpu_count() or 1)
+                args = [(paper, self.chunk_size, self.chunk_overlap) for paper in papers]
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    for chunks in executor.map(_chunk_paper_worker, args):
+                        for chunk in chunks:
+                            batch.append(chunk)
+                return batch
+            except Exception as e:
+                logger.error(f"Parallel chunking failed, falling back to sequential: {e}")
+                batch = ChunkBatch()
+
         for paper in papers:
             try:
-                chunks = self.chunk_paper(paper)
-                all_chunks.extend(chunks)
+                for chunk in self.chunk_paper(paper):
+                    batch.append(chunk)
             except Exception as e:
                 logger.error(f"Error chunking paper {paper.title}: {e}")
                 continue
-        
-        return all_chunks
+
+        return batch
     
     def get_chunk_statistics(self, chunks: List[Chunk]) -> Dict[str, Any]:
         """Get statistics about chunks"""
@@ -167,3 +265,24 @@ class SemanticChunker:
             'max_chunk_length': max(chunk_lengths),
             'total_characters': sum(chunk_lengths)
         }
+
+# One chunker per worker process, created lazily and reused across tasks
+# so the text-processing pipelines load once per worker, not per paper
+_worker_chunker: Optional[SemanticChunker] = None
+
+def _chunk_paper_worker(args) -> List[Chunk]:
+    """Chunk one paper inside a worker process"""
+    paper, chunk_size, chunk_overlap = args
+    global _worker_chunker
+
+    if (_worker_chunker is None
+            or _worker_chunker.chunk_size != chunk_size
+            or _worker_chunker.chunk_overlap != chunk_overlap):
+        _worker_chunker = SemanticChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+    try:
+        # Materialize here - generators cannot cross the process boundary
+        return list(_worker_chunker.chunk_paper(paper))
+    except Exception as e:
+        logger.error(f"Error chunking paper {paper.title}: {e}")
+        return []
@@ -10,21 +10,57 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import time - these run for every paper
+# and every paragraph, so the per-call re-cache lookup adds up
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.\,\;\:\!\?\-\(\)\[\]\{\}\"\'\/\\]')
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n|\r\n\s*\r\n')
+# One alternation so citation removal walks the text once instead of
+# three times; "et al. (year)" comes before the bare parenthetical so
+# the author prefix is consumed with the citation
+_CITATION_RE = re.compile(
+    r'\w+\s+et\s+al\.\s*\(\d{4}\)'
+    r'|\[\d+(?:,\s*\d+)*\]'
+    r'|\([^)]*\d{4}[^)]*\)',
+    re.IGNORECASE
+)
+_HORIZONTAL_WS_RE = re.compile(r'[ \t]+')
+
 class TextProcessor:
     """Text preprocessing and cleaning utilities"""
     
     def __init__(self):
         self.nlp = None
+        self._full_nlp = None
         self._load_spacy()
         self._download_nltk_data()
-    
+
     def _load_spacy(self):
-        """Load spaCy model"""
+        """Load spaCy model with a sentence-splitting-only pipeline
+
+        Sentence extraction only needs sentence boundaries; running the
+        full tagger/parser pipeline for that is orders of magnitude more
+        work than a rule-based sentencizer. The full pipeline is loaded
+        lazily in _get_full_nlp only if key-phrase extraction is used.
+        """
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load(
+                "en_core_web_sm",
+                disable=["tagger", "parser", "ner", "attribute_ruler", "lemmatizer"]
+            )
+            self.nlp.add_pipe("sentencizer")
         except OSError:
             logger.warning("spaCy model 'en_core_web_sm' not found. Run: python -m spacy download en_core_web_sm")
             self.nlp = None
+
+    def _get_full_nlp(self):
+        """Load the full spaCy pipeline (needed for noun chunks and entities)"""
+        if self._full_nlp is None and self.nlp is not None:
+            try:
+                self._full_nlp = spacy.load("en_core_web_sm")
+            except OSError:
+                logger.warning("spaCy model 'en_core_web_sm' not found. Run: python -m spacy download en_core_web_sm")
+        return self._full_nlp
     
     def _download_nltk_data(self):
         """Download required NLTK data"""
@@ -41,19 +77,14 @@ class TextProcessor:
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
         # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s\.\,\;\:\!\?\-\(\)\[\]\{\}\"\'\/\\]', ' ', text)
-        
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Strip leading/trailing whitespace
-        text = text.strip()
-        
-        return text
+        text = _SPECIAL_CHARS_RE.sub(' ', text)
+
+        # One whitespace pass at the end collapses both the original
+        # runs and the spaces the substitution above introduced - the
+        # earlier collapse-substitute-collapse chain allocated an extra
+        # full copy for the same output
+        return _WHITESPACE_RE.sub(' ', text).strip()
     
     def extract_sentences(self, text: str) -> List[str]:
         """Extract sentences from text"""
@@ -77,7 +108,7 @@ class TextProcessor:
             return []
         
         # Split by double newlines or common paragraph separators
-        paragraphs = re.split(r'\n\s*\n|\r\n\s*\r\n', text)
+        paragraphs = _PARAGRAPH_SPLIT_RE.split(text)
         
         # Clean and filter empty paragraphs
         cleaned_paragraphs = []
@@ -95,21 +126,21 @@ class TextProcessor:
         
         # Remove common citation patterns
         # [1], [2,3], (Author, Year), etc.
-        text = re.sub(r'\[\d+(?:,\s*\d+)*\]', '', text)
-        text = re.sub(r'\([^)]*\d{4}[^)]*\)', '', text)
-        text = re.sub(r'\w+\s+et\s+al\.\s*\(\d{4}\)', '', text, flags=re.IGNORECASE)
-        
-        # Clean up extra spaces
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _CITATION_RE.sub('', text)
+
+        # Clean up extra spaces without touching newlines - paragraph
+        # separators must survive for the chunker to split on
+        text = _HORIZONTAL_WS_RE.sub(' ', text).strip()
         
         return text
     
     def extract_key_phrases(self, text: str, max_phrases: int = 10) -> List[str]:
         """Extract key phrases from text"""
-        if not text or not self.nlp:
+        nlp = self._get_full_nlp()
+        if not text or not nlp:
             return []
-        
-        doc = self.nlp(text)
+
+        doc = nlp(text)
         
         # Extract noun chunks and named entities
         phrases = []
@@ -129,17 +160,19 @@ class TextProcessor:
         return unique_phrases[:max_phrases]
     
     def preprocess_paper_content(self, title: str, abstract: str, content: str = "") -> str:
-        """Preprocess paper content for chunking"""
+        """Preprocess paper content for chunking
+
+        Whitespace normalization is deliberately NOT applied to the full
+        text here: clean_text collapses the blank lines that
+        extract_paragraphs splits on, which used to merge every paper
+        into one giant paragraph and force the character-window fallback.
+        Paragraphs are cleaned individually in extract_paragraphs instead.
+        """
         # Combine title, abstract, and content
         full_text = f"Title: {title}\n\nAbstract: {abstract}"
-        
+
         if content:
             full_text += f"\n\nContent: {content}"
-        
-        # Clean the text
-        cleaned_text = self.clean_text(full_text)
-        
-        # Remove citations for cleaner chunking
-        cleaned_text = self.remove_citations(cleaned_text)
-        
-        return cleaned_text
+
+        # Remove citations for cleaner chunking (preserves paragraph breaks)
+        return self.remove_citations(full_text)
@@ -2,7 +2,23 @@
 Query processing and retrieval modules
 """
 
-from .retriever import Retriever
-from .query_processor import QueryProcessor
+import importlib
 
-__all__ = ['Retriever', 'QueryProcessor']
+# Lazy attribute loading (PEP 562), mirroring the top-level package:
+# importing QueryProcessor alone must not drag in Retriever's
+# VectorStore dependency chain (chromadb, sentence-transformers)
+_LAZY_IMPORTS = {
+    'Retriever': '.retriever',
+    'QueryProcessor': '.query_processor',
+    'QueryCache': '.query_cache',
+}
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = attr
+    return attr
+
+__all__ = ['Retriever', 'QueryProcessor', 'QueryCache']
@@ -0,0 +1,49 @@
+"""
+Semantic cache for retrieval results
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from ..semantic_cache import SemanticCache
+
+class QueryCache(SemanticCache):
+    """LRU cache of retrieval results with semantic near-hit lookup
+
+    Repeat queries are common in RAG traffic, so retrieval results are
+    cached two ways: an exact lookup keyed on a hash of the query text
+    and retrieval parameters, and an approximate lookup that compares
+    the query embedding against the embeddings of cached queries. A
+    near-hit still costs one query embedding but skips the ANN search
+    and query expansion.
+    """
+
+    _log_name = "Query"
+
+    def _make_key(self, query: str, top_k: int, similarity_threshold: float) -> str:
+        raw = f"{query}|{top_k}|{similarity_threshold}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_exact(self, query: str, top_k: int, similarity_threshold: float) -> Optional[List[Dict[str, Any]]]:
+        """Look up cached results for this exact query and parameters"""
+        return self._lookup_exact(self._make_key(query, top_k, similarity_threshold))
+
+    def get_similar(self, query_embedding, top_k: int,
+                    similarity_threshold: float) -> Optional[List[Dict[str, Any]]]:
+        """Look up cached results for a semantically near-identical query"""
+        return self._lookup_similar(
+            query_embedding,
+            lambda entry: (entry['top_k'] == top_k
+                           and entry['similarity_threshold'] == similarity_threshold)
+        )
+
+    def put(self, query: str, top_k: int, similarity_threshold: float,
+            results: List[Dict[str, Any]], query_embedding=None):
+        """Cache retrieval results (embedding enables near-hit lookup)"""
+        self._store(
+            self._make_key(query, top_k, similarity_threshold),
+            results,
+            query_embedding=query_embedding,
+            top_k=top_k,
+            similarity_threshold=similarity_threshold
+        )
@@ -3,54 +3,110 @@ Query processing and enhancement
 """
 
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import logging
 from ..processors.text_processor import TextProcessor
 
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True)
+class ProcessedQuery:
+    """Precomputed retrieval inputs for one query
+
+    Fixed attributes instead of a dict of string keys - cheaper to build
+    on every retrieve call, and frozen so cached instances can be handed
+    out without copying. (slots would shave a little more but needs
+    Python 3.10; the package still supports 3.8.)
+    """
+    original_query: str
+    processed_query: str
+    query_type: str
+    search_terms: tuple
+    expanded_queries: tuple
+
+# Stop words filtered out of search terms; built once at import instead
+# of rebuilding a set literal on every call
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of',
+    'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
+    'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she',
+    'it', 'we', 'they'
+})
+
 class QueryProcessor:
-    """Processes and enhances user queries for better retrieval"""
-    
+    """Processes and enhances user queries for better retrieval
+
+    The per-query steps (cleaning, classification, term extraction,
+    expansion) are pure functions of the query string and get called
+    several times per retrieval, so they are memoized; list-valued
+    results are cached as tuples and copied on the way out.
+    """
+
+    # Query-type patterns compiled once; one C-level regex scan per class
+    # instead of a Python-level any() loop over a word list
+    _Q_QUESTION = re.compile(
+        r'^(what|how|why|when|where|who|which|is|are|do|does|can|could|should|would)\b')
+    _Q_COMPARISON = re.compile(
+        r'\b(compare|difference|versus|vs|better|worse|advantages|disadvantages)\b')
+    _Q_SUMMARY = re.compile(
+        r'\b(summary|overview|review|survey|introduction|background)\b')
+    _Q_METHOD = re.compile(
+        r'\b(method|technique|approach|algorithm|procedure|process)\b')
+
     def __init__(self):
         self.text_processor = TextProcessor()
-    
+
+    @lru_cache(maxsize=1024)
     def preprocess_query(self, query: str) -> str:
         """Preprocess the user query"""
         if not query:
             return ""
-        
+
         # Clean the query
         cleaned_query = self.text_processor.clean_text(query)
-        
+
         # Remove excessive whitespace
         cleaned_query = re.sub(r'\s+', ' ', cleaned_query).strip()
-        
+
         return cleaned_query
-    
+
     def expand_query(self, query: str, max_expansions: int = 3) -> List[str]:
         """Expand query with related terms and synonyms"""
+        return list(self._expand_query_cached(query, max_expansions))
+
+    @lru_cache(maxsize=1024)
+    def _expand_query_cached(self, query: str, max_expansions: int) -> tuple:
         if not query:
-            return []
-        
-        expanded_queries = [query]
-        
+            return ()
+
         # Extract key phrases
         key_phrases = self.text_processor.extract_key_phrases(query, max_expansions)
-        
+        return self._expand_from_phrases(query, tuple(key_phrases), max_expansions)
+
+    def _expand_from_phrases(self, query: str, key_phrases: tuple, max_expansions: int) -> tuple:
+        """Build expansions from already-extracted key phrases"""
+        # seen mirrors expanded_queries for O(1) membership checks
+        expanded_queries = [query]
+        seen = {query}
+
         # Create variations
         for phrase in key_phrases:
             # Add phrase as standalone query
-            if phrase not in expanded_queries:
+            if phrase not in seen:
                 expanded_queries.append(phrase)
-            
+                seen.add(phrase)
+
             # Create variations with different contexts
             variations = self._create_query_variations(phrase, query)
             for variation in variations:
-                if variation not in expanded_queries and len(expanded_queries) < max_expansions:
+                if variation not in seen and len(expanded_queries) < max_expansions:
                     expanded_queries.append(variation)
-        
-        return expanded_queries[:max_expansions]
+                    seen.add(variation)
+
+        return tuple(expanded_queries[:max_expansions])
     
     def _create_query_variations(self, key_phrase: str, original_query: str) -> List[str]:
         """Create variations of a key phrase in context"""
@@ -74,69 +130,75 @@ class QueryProcessor:
         
         return variations[:2]  # Limit variations
     
+    @lru_cache(maxsize=1024)
     def classify_query_type(self, query: str) -> str:
         """Classify the type of query"""
         query_lower = query.lower()
-        
+
         # Question patterns
-        question_words = ['what', 'how', 'why', 'when', 'where', 'who', 'which', 'is', 'are', 'do', 'does', 'can', 'could', 'should', 'would']
-        if any(query_lower.startswith(word) for word in question_words):
+        if self._Q_QUESTION.match(query_lower):
             return 'question'
-        
+
         # Comparison patterns
-        comparison_words = ['compare', 'difference', 'versus', 'vs', 'better', 'worse', 'advantages', 'disadvantages']
-        if any(word in query_lower for word in comparison_words):
+        if self._Q_COMPARISON.search(query_lower):
             return 'comparison'
-        
+
         # Summary/overview patterns
-        summary_words = ['summary', 'overview', 'review', 'survey', 'introduction', 'background']
-        if any(word in query_lower for word in summary_words):
+        if self._Q_SUMMARY.search(query_lower):
             return 'summary'
-        
+
         # Method/technique patterns
-        method_words = ['method', 'technique', 'approach', 'algorithm', 'procedure', 'process']
-        if any(word in query_lower for word in method_words):
+        if self._Q_METHOD.search(query_lower):
             return 'method'
-        
+
         # Default to general search
         return 'general'
     
     def extract_search_terms(self, query: str) -> List[str]:
         """Extract key search terms from query"""
+        return list(self._extract_search_terms_cached(query))
+
+    @lru_cache(maxsize=1024)
+    def _extract_search_terms_cached(self, query: str) -> tuple:
         if not query:
-            return []
-        
+            return ()
+
         # Clean and preprocess
         cleaned_query = self.preprocess_query(query)
-        
+
         # Extract key phrases
         key_phrases = self.text_processor.extract_key_phrases(cleaned_query, 5)
-        
-        # Also extract individual important words
-        words = cleaned_query.split()
-        important_words = []
-        
-        # Filter out common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'}
-        
-        for word in words:
-            if len(word) > 2 and word.lower() not in stop_words:
-                important_words.append(word)
+        return self._search_terms_from_cleaned(cleaned_query, tuple(key_phrases))
+
+    def _search_terms_from_cleaned(self, cleaned_query: str, key_phrases: tuple) -> tuple:
+        """Build search terms from an already-cleaned query and its phrases"""
+        # Also extract individual important words, filtering stop words
+        important_words = [
+            word for word in cleaned_query.split()
+            if len(word) > 2 and word.lower() not in _STOP_WORDS
+        ]
         
         # Combine and deduplicate
-        all_terms = key_phrases + important_words
+        all_terms = list(key_phrases) + important_words
         unique_terms = list(set(all_terms))
-        
-        return unique_terms[:10]  # Limit to 10 terms
-    
-    def optimize_query_for_retrieval(self, query: str) -> Dict[str, Any]:
-        """Optimize query for better retrieval results"""
-        processed_query = {
-            'original_query': query,
-            'processed_query': self.preprocess_query(query),
-            'query_type': self.classify_query_type(query),
-            'search_terms': self.extract_search_terms(query),
-            'expanded_queries': self.expand_query(query)
-        }
-        
-        return processed_query
+
+        return tuple(unique_terms[:10])  # Limit to 10 terms
+
+    @lru_cache(maxsize=1024)
+    def optimize_query_for_retrieval(self, query: str) -> ProcessedQuery:
+        """Optimize query for better retrieval results
+
+        Cleans once and extracts key phrases once, feeding both search
+        terms and expansions (each used to redo both). The frozen result
+        is memoized and shared across repeat calls directly.
+        """
+        cleaned_query = self.preprocess_query(query)
+        key_phrases = tuple(self.text_processor.extract_key_phrases(cleaned_query, 5))
+
+        return ProcessedQuery(
+            original_query=query,
+            processed_query=cleaned_query,
+            query_type=self.classify_query_type(query),
+            search_terms=self._search_terms_from_cleaned(cleaned_query, key_phrases),
+            expanded_queries=self._expand_from_phrases(query, key_phrases[:3], 3)
+        )
@@ -2,62 +2,113 @@
 Main retrieval engine
 """
 
+import numpy as np
+from heapq import nlargest
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 import logging
 from ..embeddings.vector_store import VectorStore
 from .query_processor import QueryProcessor
+from .query_cache import QueryCache
 from ..config import Config
 
 logger = logging.getLogger(__name__)
 
 class Retriever:
     """Main retrieval engine for finding relevant paper chunks"""
-    
+
     def __init__(self, vector_store: Optional[VectorStore] = None):
         self.vector_store = vector_store or VectorStore()
         self.query_processor = QueryProcessor()
-    
+        self.query_cache = QueryCache()
+        self._cached_data_version = self.vector_store.data_version
+
+    def _invalidate_stale_cache(self):
+        """Drop cached results if the collection has changed under us
+
+        Clearing the database or ingesting new papers must not leave the
+        query cache serving chunks of the old collection (or cached empty
+        results) for the rest of its TTL.
+        """
+        if self.vector_store.data_version != self._cached_data_version:
+            self.query_cache.clear()
+            self._cached_data_version = self.vector_store.data_version
+
     def retrieve(self, query: str, top_k: int = None, similarity_threshold: float = None) -> List[Dict[str, Any]]:
         """Retrieve relevant chunks for a query"""
         if not query:
             return []
-        
+
         top_k = top_k or Config.TOP_K_RETRIEVAL
         similarity_threshold = similarity_threshold or Config.SIMILARITY_THRESHOLD
-        
+
+        self._invalidate_stale_cache()
+
+        # Exact cache hit skips query processing, embedding, and search
+        cached = self.query_cache.get_exact(query, top_k, similarity_threshold)
+        if cached is not None:
+            logger.info(f"Query cache hit for: {query[:50]}...")
+            return cached
+
         try:
-            # Process the query
-            processed_query = self.query_processor.optimize_query_for_retrieval(query)
-            
+            # Clean the query only; expansion is the expensive processing
+            # step and is deferred until the primary search falls short
+            cleaned_query = self.query_processor.preprocess_query(query)
+
+            # Embed once; the embedding serves both the semantic cache
+            # probe and the vector search
+            query_embedding = self.vector_store.embedding_manager.embed_single_text(
+                cleaned_query
+            )
+
+            if query_embedding:
+                cached = self.query_cache.get_similar(query_embedding, top_k, similarity_threshold)
+                if cached is not None:
+                    return cached
+
             # Perform initial search with main query
             results = self.vector_store.search(
-                processed_query['processed_query'],
+                cleaned_query,
                 top_k=top_k,
-                similarity_threshold=similarity_threshold
+                similarity_threshold=similarity_threshold,
+                query_embedding=query_embedding or None
             )
-            
+
             # If we don't have enough results, try expanded queries
-            if len(results) < top_k and processed_query['expanded_queries']:
-                remaining_k = top_k - len(results)
-                expanded_results = self._search_expanded_queries(
-                    processed_query['expanded_queries'],
-                    remaining_k,
-                    similarity_threshold,
-                    existing_results=results
-                )
-                results.extend(expanded_results)
-            
-            # Sort results by similarity and limit to top_k
-            results.sort(key=lambda x: x['similarity'], reverse=True)
-            results = results[:top_k]
+            if len(results) < top_k:
+                expanded_queries = self.query_processor.expand_query(query)
+                if expanded_queries:
+                    remaining_k = top_k - len(results)
+                    expanded_results = self._search_expanded_queries(
+                        expanded_queries,
+                        remaining_k,
+                        similarity_threshold,
+                        existing_results=results
+                    )
+                    results.extend(expanded_results)
+
+            # Merge by chunk_id keeping the best similarity per chunk,
+            # then take the top_k with a heap instead of a full sort
+            merged = {}
+            for result in results:
+                current = merged.get(result['chunk_id'])
+                if current is None or result['similarity'] > current['similarity']:
+                    merged[result['chunk_id']] = result
+            results = nlargest(top_k, merged.values(), key=itemgetter('similarity'))
             
-            # Add query processing metadata to results
+            # Add query processing metadata to results (both steps are
+            # memoized, so this costs little after the first call)
+            query_type = self.query_processor.classify_query_type(query)
+            search_terms = self.query_processor.extract_search_terms(query)
             for result in results:
                 result['query_metadata'] = {
-                    'query_type': processed_query['query_type'],
-                    'search_terms': processed_query['search_terms']
+                    'query_type': query_type,
+                    'search_terms': list(search_terms)
                 }
             
+            self.query_cache.put(query, top_k, similarity_threshold, results,
+                                 query_embedding=query_embedding or None)
+
             logger.info(f"Retrieved {len(results)} chunks for query: {query[:50]}...")
             return results
             
@@ -65,51 +116,97 @@ class Retriever:
             logger.error(f"Error during retrieval: {e}")
             return []
     
-    def _search_expanded_queries(self, expanded_queries: List[str], top_k: int, 
-                               similarity_threshold: float, existing_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Search using expanded queries"""
-        additional_results = []
-        existing_chunk_ids = {result['chunk_id'] for result in existing_results}
-        
-        for expanded_query in expanded_queries:
-            if len(additional_results) >= top_k:
-                break
-            
+    def retrieve_batch(self, queries: List[str], top_k: int = None,
+                       similarity_threshold: float = None) -> List[List[Dict[str, Any]]]:
+        """Retrieve relevant chunks for several queries at once
+
+        Queries answered by the cache are served directly; the misses are
+        embedded together and sent to the index as one multi-query call
+        instead of going through retrieve() one at a time. Results land
+        in the same order as the input queries and are cached per query.
+        """
+        if not queries:
+            return []
+
+        top_k = top_k or Config.TOP_K_RETRIEVAL
+        similarity_threshold = similarity_threshold or Config.SIMILARITY_THRESHOLD
+
+        self._invalidate_stale_cache()
+
+        results_by_index: Dict[int, List[Dict[str, Any]]] = {}
+        miss_indices = []
+
+        for i, query in enumerate(queries):
+            cached = self.query_cache.get_exact(query, top_k, similarity_threshold)
+            if cached is not None:
+                results_by_index[i] = cached
+            else:
+                miss_indices.append(i)
+
+        if miss_indices:
             try:
-                query_results = self.vector_store.search(
-                    expanded_query,
+                cleaned_queries = [
+                    self.query_processor.preprocess_query(queries[i]) for i in miss_indices
+                ]
+                per_query_results = self.vector_store.search_batch(
+                    cleaned_queries,
                     top_k=top_k,
                     similarity_threshold=similarity_threshold
                 )
-                
-                # Filter out already retrieved chunks
-                for result in query_results:
-                    if (result['chunk_id'] not in existing_chunk_ids and 
-                        len(additional_results) < top_k):
-                        result['from_expanded_query'] = True
-                        additional_results.append(result)
-                        existing_chunk_ids.add(result['chunk_id'])
-                
+                for i, results in zip(miss_indices, per_query_results):
+                    results_by_index[i] = results
+                    self.query_cache.put(queries[i], top_k, similarity_threshold, results)
             except Exception as e:
-                logger.warning(f"Error searching expanded query '{expanded_query}': {e}")
-                continue
-        
-        return additional_results
+                logger.error(f"Error during batch retrieval: {e}")
+                for i in miss_indices:
+                    results_by_index.setdefault(i, [])
+
+        return [results_by_index[i] for i in range(len(queries))]
+
+    def _search_expanded_queries(self, expanded_queries: List[str], top_k: int,
+                               similarity_threshold: float, existing_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Search all expanded queries with one batched call
+
+        The expansions are embedded together and sent to the index as one
+        multi-query call instead of a per-query loop; results are merged
+        by chunk_id keeping the best similarity per chunk.
+        """
+        existing_chunk_ids = {result['chunk_id'] for result in existing_results}
+        merged: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            per_query_results = self.vector_store.search_batch(
+                expanded_queries,
+                top_k=top_k,
+                similarity_threshold=similarity_threshold
+            )
+        except Exception as e:
+            logger.warning(f"Error searching expanded queries: {e}")
+            return []
+
+        for query_results in per_query_results:
+            for result in query_results:
+                chunk_id = result['chunk_id']
+                if chunk_id in existing_chunk_ids:
+                    continue
+                current = merged.get(chunk_id)
+                if current is None or result['similarity'] > current['similarity']:
+                    result['from_expanded_query'] = True
+                    merged[chunk_id] = result
+
+        return nlargest(top_k, merged.values(), key=itemgetter('similarity'))
     
     def retrieve_by_paper(self, paper_title: str, top_k: int = 10) -> List[Dict[str, Any]]:
-        """Retrieve chunks from a specific paper"""
+        """Retrieve chunks from a specific paper
+
+        A metadata-filtered get on the store - no embedding or ANN search
+        involved, and chunks are found even when the collection is large.
+        """
         try:
-            # Get all chunks and filter by paper title
-            all_results = self.vector_store.search(paper_title, top_k=100, similarity_threshold=0.0)
-            
-            # Filter for exact paper title matches
-            paper_chunks = []
-            for result in all_results:
-                if result['metadata'].get('paper_title', '').lower() == paper_title.lower():
-                    paper_chunks.append(result)
-            
-            return paper_chunks[:top_k]
-            
+            return self.vector_store.get_chunks_by_metadata(
+                'paper_title', paper_title, limit=top_k
+            )
+
         except Exception as e:
             logger.error(f"Error retrieving by paper title '{paper_title}': {e}")
             return []
@@ -167,17 +264,20 @@ class Retriever:
                 'suggestions': ['Try a more general query', 'Check if papers are loaded']
             }
         
-        # Calculate quality metrics
-        similarities = [result['similarity'] for result in results]
-        avg_similarity = sum(similarities) / len(similarities)
-        min_similarity = min(similarities)
-        
+        # Calculate quality metrics in one vectorized pass; fromiter
+        # fills the array directly without an intermediate list
+        similarities = np.fromiter(
+            (result['similarity'] for result in results),
+            dtype=np.float32, count=len(results)
+        )
+        avg_similarity = float(similarities.mean())
+        min_similarity = float(similarities.min())
+
         # Check result diversity
-        paper_titles = set()
-        for result in results:
-            title = result['metadata'].get('paper_title', 'Unknown')
-            paper_titles.add(title)
-        
+        paper_titles = {
+            result['metadata'].get('paper_title', 'Unknown') for result in results
+        }
+
         diversity_score = len(paper_titles) / len(results) if results else 0
         
         # Quality assessment
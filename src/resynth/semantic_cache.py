@@ -0,0 +1,107 @@
+"""
+Shared LRU cache machinery with semantic near-hit lookup
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """Base LRU cache with TTL expiry and embedding near-hit lookup
+
+    Subclasses build the exact keys and decide which stored fields must
+    match for a near-hit (the retrieval cache matches on the search
+    parameters, the answer cache on the chunk set and synthesis
+    parameters); the entry bookkeeping, TTL eviction, and the one
+    matrix-vector cosine scan over cached query embeddings live here.
+    """
+
+    # Prefix for the near-hit log line, overridden by subclasses
+    _log_name = "Semantic"
+
+    def __init__(self, max_size: int = None, ttl_seconds: float = 300.0,
+                 similarity_threshold: float = None):
+        self.max_size = max_size or Config.SIMILARITY_CACHE_SIZE
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold or Config.SIMILARITY_CACHE_THRESHOLD
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items()
+                   if now - entry['created'] > self.ttl_seconds]
+        for key in expired:
+            del self._entries[key]
+
+    def _lookup_exact(self, key: str) -> Optional[Any]:
+        """Return the cached value under this key, refreshing its LRU slot"""
+        self._evict_expired()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry['value']
+
+    def _lookup_similar(self, query_embedding,
+                        match: Callable[[Dict[str, Any]], bool]) -> Optional[Any]:
+        """Return the value of the nearest matching entry above threshold
+
+        Only entries accepted by the subclass's match predicate are
+        candidates; their embeddings are compared against the incoming
+        one with a single BLAS-backed matrix-vector product.
+        """
+        self._evict_expired()
+        candidates = [entry for entry in self._entries.values()
+                      if entry['embedding'] is not None and match(entry)]
+        if not candidates:
+            return None
+
+        embedding = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        if norm == 0:
+            return None
+        embedding = embedding / norm
+
+        matrix = np.stack([entry['embedding'] for entry in candidates])
+        similarities = matrix @ embedding
+        best = int(np.argmax(similarities))
+
+        if similarities[best] >= self.similarity_threshold:
+            logger.info(f"{self._log_name} cache near-hit (cosine {similarities[best]:.3f})")
+            return candidates[best]['value']
+        return None
+
+    def _store(self, key: str, value: Any, query_embedding=None, **match_fields):
+        """Insert a value (embedding enables near-hit lookup)
+
+        Extra keyword fields are stored on the entry for the subclass's
+        match predicate to check during near-hit lookup.
+        """
+        embedding = None
+        if query_embedding is not None:
+            embedding = np.asarray(query_embedding, dtype=np.float32)
+            norm = np.linalg.norm(embedding)
+            embedding = embedding / norm if norm > 0 else None
+
+        entry = {
+            'value': value,
+            'embedding': embedding,
+            'created': time.monotonic()
+        }
+        entry.update(match_fields)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
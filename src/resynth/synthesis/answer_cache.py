@@ -0,0 +1,71 @@
+"""
+Semantic cache for synthesized answers
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from ..semantic_cache import SemanticCache
+
+class AnswerCache(SemanticCache):
+    """LRU cache of synthesized answers with semantic near-hit lookup
+
+    The LLM round-trip dominates synthesis latency, so answers are
+    cached two ways, mirroring the retrieval QueryCache: an exact
+    lookup keyed on a hash of the query, the chunk set, and the
+    synthesis parameters, and an approximate lookup that compares the
+    query embedding against cached queries over the same chunk set. A
+    paraphrased repeat question costs one local embedding instead of a
+    generation call.
+    """
+
+    _log_name = "Answer"
+
+    def __init__(self, max_size: int = None, ttl_seconds: float = 3600.0,
+                 similarity_threshold: float = None):
+        super().__init__(max_size, ttl_seconds, similarity_threshold)
+
+    @staticmethod
+    def make_context_signature(chunks: List[Dict[str, Any]]) -> str:
+        """Hash the sorted chunk ids - same sources, same signature"""
+        chunk_ids = sorted(chunk.get('chunk_id', '') for chunk in chunks)
+        return hashlib.sha256("|".join(chunk_ids).encode("utf-8")).hexdigest()
+
+    def _make_key(self, query: str, context_signature: str,
+                  query_type: str, citation_style: str) -> str:
+        raw = f"{query}|{context_signature}|{query_type}|{citation_style}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_exact(self, query: str, context_signature: str,
+                  query_type: str, citation_style: str) -> Optional[Any]:
+        """Look up a cached answer for this exact query and context"""
+        return self._lookup_exact(
+            self._make_key(query, context_signature, query_type, citation_style)
+        )
+
+    def get_similar(self, query_embedding, context_signature: str,
+                    query_type: str, citation_style: str) -> Optional[Any]:
+        """Look up a cached answer for a semantically near-identical query
+
+        Only entries built from the same chunk set and synthesis
+        parameters are candidates - a similar question over different
+        sources must not reuse the answer.
+        """
+        return self._lookup_similar(
+            query_embedding,
+            lambda entry: (entry['context_signature'] == context_signature
+                           and entry['query_type'] == query_type
+                           and entry['citation_style'] == citation_style)
+        )
+
+    def put(self, query: str, context_signature: str, query_type: str,
+            citation_style: str, answer: Any, query_embedding=None):
+        """Cache a synthesized answer (embedding enables near-hit lookup)"""
+        self._store(
+            self._make_key(query, context_signature, query_type, citation_style),
+            answer,
+            query_embedding=query_embedding,
+            context_signature=context_signature,
+            query_type=query_type,
+            citation_style=citation_style
+        )
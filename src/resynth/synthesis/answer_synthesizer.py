@@ -2,15 +2,78 @@
 Answer synthesis from retrieved chunks
 """
 
+import numpy as np
 import openai
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
+from .answer_cache import AnswerCache
 from .citation_formatter import CitationFormatter, Citation
 from ..config import Config
 
 logger = logging.getLogger(__name__)
 
+# Concurrent in-flight generation requests; keep modest to stay under
+# default account rate limits
+_SYNTH_MAX_CONCURRENCY = 4
+
+# Sentence segments that qualify as key points: either containing a
+# digit (group 1) or at least 51 characters long. One compiled scan
+# replaces split('.') plus a per-character isdigit() loop in Python
+_KEYPOINT_RE = re.compile(r'([^.]*\d[^.]*)|[^.]{51,}')
+
+# Full system prompts per query type, assembled once at import
+_BASE_PROMPT = """You are a research assistant that synthesizes information from academic papers. Your task is to provide accurate, well-structured answers based on the provided context. Always cite your sources and be precise about what information comes from which paper."""
+
+_SYSTEM_PROMPTS = {
+    "question": _BASE_PROMPT + " For questions, provide direct, specific answers with supporting evidence from the papers.",
+    "comparison": _BASE_PROMPT + " For comparisons, clearly identify similarities and differences between approaches, methods, or findings.",
+    "summary": _BASE_PROMPT + " For summaries, provide a comprehensive overview of the key points and findings.",
+    "method": _BASE_PROMPT + " For method-related queries, explain techniques, procedures, and implementations in detail.",
+    "general": _BASE_PROMPT + " Provide a comprehensive and informative response.",
+}
+
+@dataclass
+class RetrievedChunks:
+    """Struct-of-arrays view of retrieved chunks
+
+    Synthesis walks the same chunk fields many times; pulling them into
+    parallel columns once at entry replaces per-access dict lookups in
+    the hot loops and lets similarity math run as numpy operations. The
+    original dicts are kept for consumers that need the full records
+    (citation formatting, cache signatures, source_chunks).
+    """
+    texts: List[str]
+    similarities: np.ndarray
+    metadatas: List[Dict[str, Any]]
+    chunks: List[Dict[str, Any]]
+
+    @classmethod
+    def from_chunks(cls, chunks: List[Dict[str, Any]]) -> "RetrievedChunks":
+        return cls(
+            texts=[chunk.get('text', '') for chunk in chunks],
+            similarities=np.fromiter(
+                (chunk.get('similarity', 0) for chunk in chunks),
+                dtype=np.float32, count=len(chunks)
+            ),
+            metadatas=[chunk.get('metadata', {}) for chunk in chunks],
+            chunks=list(chunks)
+        )
+
+    def select(self, indices: List[int]) -> "RetrievedChunks":
+        """New batch holding only the chunks at the given indices"""
+        return RetrievedChunks(
+            texts=[self.texts[i] for i in indices],
+            similarities=self.similarities[np.asarray(indices, dtype=np.intp)],
+            metadatas=[self.metadatas[i] for i in indices],
+            chunks=[self.chunks[i] for i in indices]
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
 @dataclass
 class SynthesizedAnswer:
     """Represents a synthesized answer with citations"""
@@ -20,6 +83,9 @@ class SynthesizedAnswer:
     confidence_score: float
     source_chunks: List[Dict[str, Any]]
     query_type: str
+    # True when generation failed and this is the degraded fallback
+    # text; such answers must not enter the answer cache
+    from_fallback: bool = False
 
 class AnswerSynthesizer:
     """Synthesizes answers from retrieved paper chunks"""
@@ -27,16 +93,38 @@ class AnswerSynthesizer:
     def __init__(self, use_openai: bool = True):
         self.use_openai = use_openai and bool(Config.OPENAI_API_KEY)
         self.citation_formatter = CitationFormatter()
-        
+        self.answer_cache = AnswerCache()
+
+        # Local-synthesis dispatch table; summary is handled separately
+        # because it takes no query argument
+        self._qtype_methods = {
+            "question": self._answer_question,
+            "comparison": self._create_comparison,
+            "method": self._explain_methods,
+        }
+
         if self.use_openai:
-            openai.api_key = Config.OPENAI_API_KEY
+            # One persistent client for the synthesizer's lifetime; its
+            # pooled connections keep TLS sessions alive across calls
+            # instead of handshaking per request through the module-level
+            # helpers, and the thread pool in the batch path shares them
+            self._client = openai.OpenAI(api_key=Config.OPENAI_API_KEY, timeout=60.0)
             logger.info("Using OpenAI for answer synthesis")
         else:
+            self._client = None
             logger.info("Using local synthesis methods")
-    
-    def synthesize_answer(self, query: str, retrieved_chunks: List[Dict[str, Any]], 
+
+    def synthesize_answer(self, query: str, retrieved_chunks: Union[List[Dict[str, Any]], RetrievedChunks],
                          query_type: str = "general", citation_style: str = "numeric") -> SynthesizedAnswer:
-        """Synthesize an answer from retrieved chunks"""
+        """Synthesize an answer from retrieved chunks
+
+        Accepts either the raw chunk dicts or an already-built
+        RetrievedChunks; the columnar form is normalized once here and
+        reused by every downstream step. Answers are cached per
+        (query, chunk set, parameters); a repeat or near-paraphrase of
+        a prior question over the same sources is served from the cache
+        without a generation call.
+        """
         if not retrieved_chunks:
             return SynthesizedAnswer(
                 answer="I couldn't find relevant information to answer your question. Please try rephrasing your query or check if relevant papers are loaded.",
@@ -46,23 +134,178 @@ class AnswerSynthesizer:
                 source_chunks=[],
                 query_type=query_type
             )
-        
+
+        batch = (retrieved_chunks if isinstance(retrieved_chunks, RetrievedChunks)
+                 else RetrievedChunks.from_chunks(retrieved_chunks))
+
+        # A chunk set this weakly related to the query cannot support an
+        # answer; skip the whole generation pipeline rather than paying
+        # for a completion that would say as much
+        avg_similarity = float(batch.similarities.mean())
+        if avg_similarity < Config.MIN_SYNTHESIS_SIMILARITY:
+            logger.info(f"Skipping synthesis: mean similarity {avg_similarity:.3f} below threshold")
+            return SynthesizedAnswer(
+                answer="The retrieved papers don't contain information relevant enough to answer your question. Please try rephrasing your query or check if relevant papers are loaded.",
+                citations={},
+                bibliography="",
+                confidence_score=avg_similarity,
+                source_chunks=batch.chunks,
+                query_type=query_type
+            )
+
+        context_signature = AnswerCache.make_context_signature(batch.chunks)
+        cached = self.answer_cache.get_exact(query, context_signature, query_type, citation_style)
+        if cached is not None:
+            logger.info(f"Answer cache hit for: {query[:50]}...")
+            return cached
+
+        query_embedding = self._embed_query(query)
+        if query_embedding is not None:
+            cached = self.answer_cache.get_similar(
+                query_embedding, context_signature, query_type, citation_style
+            )
+            if cached is not None:
+                return cached
+
         try:
             if self.use_openai:
-                return self._synthesize_with_openai(query, retrieved_chunks, query_type, citation_style)
+                answer = self._synthesize_with_openai(query, batch, query_type, citation_style)
             else:
-                return self._synthesize_locally(query, retrieved_chunks, query_type, citation_style)
-                
+                answer = self._synthesize_locally(query, batch, query_type, citation_style)
+
+            # A transient generation failure must not pin its degraded
+            # answer to this query for the whole cache TTL
+            if not answer.from_fallback:
+                self.answer_cache.put(query, context_signature, query_type, citation_style,
+                                      answer, query_embedding=query_embedding)
+            return answer
+
         except Exception as e:
             logger.error(f"Error synthesizing answer: {e}")
-            return self._fallback_synthesis(query, retrieved_chunks, query_type, citation_style)
+            return self._fallback_synthesis(query, batch.chunks, query_type, citation_style)
+
+    def synthesize_answers_batch(self, queries: List[str],
+                                 chunks_per_query: List[List[Dict[str, Any]]],
+                                 query_types: Optional[List[str]] = None,
+                                 citation_style: str = "numeric") -> List[SynthesizedAnswer]:
+        """Synthesize answers for several queries concurrently
+
+        Each synthesis is dominated by the generation round-trip, so the
+        requests are issued from a small thread pool and overlap into
+        roughly one round-trip of wall clock instead of one per query.
+        The per-query path (including the answer cache) is unchanged.
+        """
+        if not queries:
+            return []
+
+        query_types = query_types or ["general"] * len(queries)
+
+        if len(queries) == 1:
+            return [self.synthesize_answer(
+                queries[0], chunks_per_query[0], query_types[0], citation_style
+            )]
+
+        with ThreadPoolExecutor(max_workers=min(len(queries), _SYNTH_MAX_CONCURRENCY)) as executor:
+            futures = [
+                executor.submit(self.synthesize_answer, query, chunks, query_type, citation_style)
+                for query, chunks, query_type in zip(queries, chunks_per_query, query_types)
+            ]
+            return [future.result() for future in futures]
+
+    def _embed_query(self, query: str):
+        """Embed the query with the shared local model for cache lookups
+
+        Uses the process-wide embedding manager (the same instance the
+        vector store holds), so no extra model load and no API call; the
+        single-text path is itself memoized.
+        """
+        try:
+            from ..embeddings.vector_store import _get_embedding_manager
+            embedding = _get_embedding_manager(None, False).embed_single_text(query)
+            return embedding or None
+        except Exception as e:
+            logger.warning(f"Could not embed query for answer cache: {e}")
+            return None
     
-    def _synthesize_with_openai(self, query: str, chunks: List[Dict[str, Any]], 
+    def synthesize_answer_stream(self, query: str, retrieved_chunks: Union[List[Dict[str, Any]], RetrievedChunks],
+                                 query_type: str = "general"):
+        """Stream the raw (uncited) answer text as it is generated
+
+        Yields content deltas from the OpenAI streaming API so callers can
+        render progressively; use finalize_answer() on the drained text to
+        attach citations, bibliography and confidence. Local synthesis is
+        CPU-only and fast, so it yields its answer in a single piece.
+        """
+        if not retrieved_chunks:
+            yield ("I couldn't find relevant information to answer your question. "
+                   "Please try rephrasing your query or check if relevant papers are loaded.")
+            return
+
+        batch = (retrieved_chunks if isinstance(retrieved_chunks, RetrievedChunks)
+                 else RetrievedChunks.from_chunks(retrieved_chunks))
+
+        if not self.use_openai:
+            yield self._generate_local_answer(query, batch, query_type)
+            return
+
+        context = self._prepare_context(batch)
+        system_prompt = self._create_system_prompt(query_type)
+        user_prompt = f"""Query: {query}
+
+Context from research papers:
+{context}
+
+Please provide a comprehensive answer to the query based on the provided context. Include specific information and cite the relevant sources. Be accurate and only use information from the provided context."""
+
+        try:
+            response = self._client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=1000,
+                temperature=0.3,
+                stream=True
+            )
+
+            for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+
+        except Exception as e:
+            logger.error(f"Error in OpenAI streaming synthesis: {e}")
+            yield self._generate_local_answer(query, batch, query_type)
+
+    def finalize_answer(self, query: str, answer: str, chunks: Union[List[Dict[str, Any]], RetrievedChunks],
+                        query_type: str = "general", citation_style: str = "numeric") -> SynthesizedAnswer:
+        """Build a SynthesizedAnswer from already-generated answer text"""
+        batch = chunks if isinstance(chunks, RetrievedChunks) else RetrievedChunks.from_chunks(chunks)
+
+        cited_answer, citations = self.citation_formatter.add_citations_to_text(
+            answer, batch.chunks, citation_style
+        )
+
+        bibliography = self.citation_formatter.generate_bibliography(citations, citation_style)
+
+        confidence = self._calculate_confidence_score(batch, answer)
+
+        return SynthesizedAnswer(
+            answer=cited_answer,
+            citations=citations,
+            bibliography=bibliography,
+            confidence_score=confidence,
+            source_chunks=batch.chunks,
+            query_type=query_type
+        )
+
+    def _synthesize_with_openai(self, query: str, batch: RetrievedChunks,
                                query_type: str, citation_style: str) -> SynthesizedAnswer:
         """Synthesize answer using OpenAI"""
-        
+
         # Prepare context from chunks
-        context = self._prepare_context(chunks)
+        context = self._prepare_context(batch)
         
         # Create prompt based on query type
         system_prompt = self._create_system_prompt(query_type)
@@ -74,7 +317,7 @@ Context from research papers:
 Please provide a comprehensive answer to the query based on the provided context. Include specific information and cite the relevant sources. Be accurate and only use information from the provided context."""
         
         try:
-            response = openai.chat.completions.create(
+            response = self._client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -85,137 +328,159 @@ Please provide a comprehensive answer to the query based on the provided context
             )
             
             answer = response.choices[0].message.content
-            
+
             # Add citations
             cited_answer, citations = self.citation_formatter.add_citations_to_text(
-                answer, chunks, citation_style
+                answer, batch.chunks, citation_style
             )
-            
+
             # Generate bibliography
             bibliography = self.citation_formatter.generate_bibliography(citations, citation_style)
-            
+
             # Calculate confidence score
-            confidence = self._calculate_confidence_score(chunks, answer)
-            
+            confidence = self._calculate_confidence_score(batch, answer)
+
             return SynthesizedAnswer(
                 answer=cited_answer,
                 citations=citations,
                 bibliography=bibliography,
                 confidence_score=confidence,
-                source_chunks=chunks,
+                source_chunks=batch.chunks,
                 query_type=query_type
             )
-            
+
         except Exception as e:
             logger.error(f"Error in OpenAI synthesis: {e}")
-            return self._fallback_synthesis(query, chunks, query_type, citation_style)
-    
-    def _synthesize_locally(self, query: str, chunks: List[Dict[str, Any]], 
+            return self._fallback_synthesis(query, batch.chunks, query_type, citation_style)
+
+    def _synthesize_locally(self, query: str, batch: RetrievedChunks,
                            query_type: str, citation_style: str) -> SynthesizedAnswer:
         """Synthesize answer using local methods"""
-        
-        # Extract and combine relevant information
-        relevant_info = self._extract_relevant_information(query, chunks)
-        
-        # Generate answer based on query type
-        if query_type == "question":
-            answer = self._answer_question(query, relevant_info)
-        elif query_type == "comparison":
-            answer = self._create_comparison(query, relevant_info)
-        elif query_type == "summary":
-            answer = self._create_summary(relevant_info)
-        elif query_type == "method":
-            answer = self._explain_methods(query, relevant_info)
-        else:
-            answer = self._create_general_answer(query, relevant_info)
-        
+
+        answer = self._generate_local_answer(query, batch, query_type)
+
         # Add citations
         cited_answer, citations = self.citation_formatter.add_citations_to_text(
-            answer, chunks, citation_style
+            answer, batch.chunks, citation_style
         )
-        
+
         # Generate bibliography
         bibliography = self.citation_formatter.generate_bibliography(citations, citation_style)
-        
+
         # Calculate confidence score
-        confidence = self._calculate_confidence_score(chunks, answer)
-        
+        confidence = self._calculate_confidence_score(batch, answer)
+
         return SynthesizedAnswer(
             answer=cited_answer,
             citations=citations,
             bibliography=bibliography,
             confidence_score=confidence,
-            source_chunks=chunks,
+            source_chunks=batch.chunks,
             query_type=query_type
         )
-    
-    def _prepare_context(self, chunks: List[Dict[str, Any]]) -> str:
+
+    def _generate_local_answer(self, query: str, batch: RetrievedChunks,
+                               query_type: str) -> str:
+        """Generate raw answer text using local methods"""
+        # Extract and combine relevant information
+        relevant_info = self._extract_relevant_information(query, batch)
+
+        # Generate answer based on query type
+        if query_type == "summary":
+            return self._create_summary(relevant_info)
+
+        method = self._qtype_methods.get(query_type, self._create_general_answer)
+        return method(query, relevant_info)
+
+    @staticmethod
+    def _dedupe_chunks(batch: RetrievedChunks, threshold: float = 0.85) -> RetrievedChunks:
+        """Drop near-duplicate chunks before prompt assembly
+
+        Retrieval often returns overlapping passages (adjacent chunks
+        share their overlap region); pruning them trims prompt tokens
+        without losing content. Exact Jaccard over word sets is fine at
+        top-k scale - no sketching needed for a handful of chunks.
+        """
+        kept_indices = []
+        kept_word_sets = []
+
+        for i, text in enumerate(batch.texts):
+            words = set(text.lower().split())
+            duplicate = False
+            for other in kept_word_sets:
+                union = len(words | other)
+                if union and len(words & other) / union > threshold:
+                    duplicate = True
+                    break
+            if not duplicate:
+                kept_indices.append(i)
+                kept_word_sets.append(words)
+
+        if len(kept_indices) == len(batch):
+            return batch
+        logger.info(f"Dropped {len(batch) - len(kept_indices)} near-duplicate chunks from context")
+        return batch.select(kept_indices)
+
+    def _prepare_context(self, batch: RetrievedChunks) -> str:
         """Prepare context from chunks for synthesis"""
         context_parts = []
-        
-        for i, chunk in enumerate(chunks):
-            metadata = chunk.get('metadata', {})
+
+        batch = self._dedupe_chunks(batch)
+        for i, (text, metadata) in enumerate(zip(batch.texts, batch.metadatas)):
             paper_title = metadata.get('paper_title', 'Unknown Paper')
             authors = metadata.get('paper_authors', [])
             author_text = ", ".join(authors[:3])  # Limit to first 3 authors
             if len(authors) > 3:
                 author_text += " et al."
-            
+
             context_parts.append(f"""
 Source {i+1}: {paper_title}
 Authors: {author_text}
-Content: {chunk.get('text', '')}
-Similarity Score: {chunk.get('similarity', 0):.3f}
+Content: {text}
+Similarity Score: {batch.similarities[i]:.3f}
 """)
-        
+
         return "\n".join(context_parts)
     
     def _create_system_prompt(self, query_type: str) -> str:
         """Create system prompt based on query type"""
-        base_prompt = """You are a research assistant that synthesizes information from academic papers. Your task is to provide accurate, well-structured answers based on the provided context. Always cite your sources and be precise about what information comes from which paper."""
-        
-        if query_type == "question":
-            return base_prompt + " For questions, provide direct, specific answers with supporting evidence from the papers."
-        elif query_type == "comparison":
-            return base_prompt + " For comparisons, clearly identify similarities and differences between approaches, methods, or findings."
-        elif query_type == "summary":
-            return base_prompt + " For summaries, provide a comprehensive overview of the key points and findings."
-        elif query_type == "method":
-            return base_prompt + " For method-related queries, explain techniques, procedures, and implementations in detail."
-        else:
-            return base_prompt + " Provide a comprehensive and informative response."
+        return _SYSTEM_PROMPTS.get(query_type, _SYSTEM_PROMPTS["general"])
     
-    def _extract_relevant_information(self, query: str, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _extract_relevant_information(self, query: str, batch: RetrievedChunks) -> List[Dict[str, Any]]:
         """Extract most relevant information from chunks"""
-        # Sort chunks by similarity
-        sorted_chunks = sorted(chunks, key=lambda x: x.get('similarity', 0), reverse=True)
-        
+        # Sort chunks by similarity, pruning near-duplicates first
+        batch = self._dedupe_chunks(batch)
+        order = np.argsort(-batch.similarities, kind='stable')[:5]  # Use top 5 chunks
+
         # Extract key information from top chunks
         relevant_info = []
-        for chunk in sorted_chunks[:5]:  # Use top 5 chunks
+        for i in order:
+            text = batch.texts[i]
             info = {
-                'text': chunk.get('text', ''),
-                'paper_title': chunk.get('metadata', {}).get('paper_title', ''),
-                'similarity': chunk.get('similarity', 0),
-                'key_points': self._extract_key_points(chunk.get('text', ''))
+                'text': text,
+                'paper_title': batch.metadatas[i].get('paper_title', ''),
+                'similarity': float(batch.similarities[i]),
+                'key_points': self._extract_key_points(text)
             }
             relevant_info.append(info)
-        
+
         return relevant_info
     
     def _extract_key_points(self, text: str) -> List[str]:
         """Extract key points from text"""
-        sentences = text.split('.')
         key_points = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 20:  # Filter very short sentences
-                # Simple heuristic: sentences with numbers, specific terms, or length
-                if any(char.isdigit() for char in sentence) or len(sentence) > 50:
-                    key_points.append(sentence)
-        
-        return key_points[:3]  # Limit to 3 key points per chunk
+
+        # The pattern already encodes the digit/length heuristic; only
+        # short matches (after stripping) still need filtering here, and
+        # the scan stops as soon as three points are found
+        for match in _KEYPOINT_RE.finditer(text):
+            sentence = match.group().strip()
+            if len(sentence) > 20 and (match.group(1) is not None or len(sentence) > 50):
+                key_points.append(sentence)
+                if len(key_points) == 3:  # Limit to 3 key points per chunk
+                    break
+
+        return key_points
     
     def _answer_question(self, query: str, relevant_info: List[Dict[str, Any]]) -> str:
         """Generate answer for question-type queries"""
@@ -248,13 +513,8 @@ Similarity Score: {chunk.get('similarity', 0):.3f}
             all_points.extend(info['key_points'])
         
         # Remove duplicates while preserving order
-        seen = set()
-        unique_points = []
-        for point in all_points:
-            if point not in seen:
-                seen.add(point)
-                unique_points.append(point)
-        
+        unique_points = list(dict.fromkeys(all_points))
+
         answer_parts.extend([f"- {point}" for point in unique_points[:10]])
         
         return "\n".join(answer_parts)
@@ -281,17 +541,17 @@ Similarity Score: {chunk.get('similarity', 0):.3f}
         
         return "\n".join(answer_parts)
     
-    def _calculate_confidence_score(self, chunks: List[Dict[str, Any]], answer: str) -> float:
+    def _calculate_confidence_score(self, batch: RetrievedChunks, answer: str) -> float:
         """Calculate confidence score for the answer"""
-        if not chunks or not answer:
+        if not len(batch) or not answer:
             return 0.0
-        
+
         # Factors affecting confidence:
-        # 1. Average similarity score of chunks
-        avg_similarity = sum(chunk.get('similarity', 0) for chunk in chunks) / len(chunks)
-        
+        # 1. Average similarity score of chunks (already a numpy column)
+        avg_similarity = float(batch.similarities.mean())
+
         # 2. Number of relevant chunks
-        chunk_factor = min(len(chunks) / 5.0, 1.0)  # Normalize to max 1.0
+        chunk_factor = min(len(batch) / 5.0, 1.0)  # Normalize to max 1.0
         
         # 3. Answer length (longer answers might be more comprehensive)
         length_factor = min(len(answer) / 500.0, 1.0)  # Normalize to max 1.0
@@ -304,14 +564,16 @@ Similarity Score: {chunk.get('similarity', 0):.3f}
     def _fallback_synthesis(self, query: str, chunks: List[Dict[str, Any]], 
                            query_type: str, citation_style: str) -> SynthesizedAnswer:
         """Fallback synthesis method"""
-        answer = f"I found some relevant information about '{query}' in the research papers, but I'm having trouble generating a comprehensive response. Here are the key points I found:\n\n"
-        
+        parts = [f"I found some relevant information about '{query}' in the research papers, but I'm having trouble generating a comprehensive response. Here are the key points I found:\n\n"]
+
         for i, chunk in enumerate(chunks[:3]):
             metadata = chunk.get('metadata', {})
             paper_title = metadata.get('paper_title', 'Unknown Paper')
             text = chunk.get('text', '')[:200]  # First 200 chars
-            
-            answer += f"{i+1}. From '{paper_title}': {text}...\n\n"
+
+            parts.append(f"{i+1}. From '{paper_title}': {text}...\n\n")
+
+        answer = "".join(parts)
         
         return SynthesizedAnswer(
             answer=answer,
@@ -319,5 +581,6 @@ Similarity Score: {chunk.get('similarity', 0):.3f}
             bibliography="",
             confidence_score=0.5,
             source_chunks=chunks,
-            query_type=query_type
+            query_type=query_type,
+            from_fallback=True
         )
@@ -4,9 +4,25 @@ Citation formatting and management
 
 from typing import List, Dict, Any, Optional
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from datetime import datetime
 
+import numpy as np
+
+# Patterns compiled once at import; both sit on per-call paths
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Common words ignored by the citation overlap heuristic; built once at
+# import instead of per annotation call
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of',
+    'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
+    'might', 'can', 'this', 'that', 'these', 'those'
+})
+
 @dataclass
 class Citation:
     """Represents a citation"""
@@ -20,37 +36,62 @@ class Citation:
     pubmed_id: Optional[str] = None
     citation_number: Optional[int] = None
 
+@lru_cache(maxsize=4096)
+def _citation_from_fields(title: str, authors: tuple, published_date,
+                          journal: Optional[str], doi: Optional[str],
+                          url: Optional[str], arxiv_id: Optional[str],
+                          pubmed_id: Optional[str]) -> Citation:
+    """Build a citation from frozen metadata fields
+
+    The same paper's metadata is turned into a Citation over and over
+    (every citation map rebuilds from chunks), so the parse - including
+    the year regex on string dates - is memoized on the field tuple.
+    """
+    # Extract year from published_date if available
+    year = None
+    if published_date:
+        if isinstance(published_date, datetime):
+            year = published_date.year
+        elif isinstance(published_date, str):
+            # Try to extract year from string
+            year_match = _YEAR_RE.search(published_date)
+            if year_match:
+                year = int(year_match.group())
+
+    return Citation(
+        paper_title=title,
+        authors=list(authors),
+        year=year,
+        journal=journal,
+        doi=doi,
+        url=url,
+        arxiv_id=arxiv_id,
+        pubmed_id=pubmed_id
+    )
+
 class CitationFormatter:
     """Formats citations in various academic styles"""
-    
+
     def __init__(self):
         self.citation_counter = 0
         self.citations = {}
-    
+
     def create_citation_from_metadata(self, metadata: Dict[str, Any]) -> Citation:
         """Create a citation object from chunk metadata"""
-        # Extract year from published_date if available
-        year = None
-        published_date = metadata.get('paper_published_date')
-        if published_date:
-            if isinstance(published_date, datetime):
-                year = published_date.year
-            elif isinstance(published_date, str):
-                # Try to extract year from string
-                year_match = re.search(r'\b(19|20)\d{2}\b', published_date)
-                if year_match:
-                    year = int(year_match.group())
-        
-        return Citation(
-            paper_title=metadata.get('paper_title', 'Unknown Title'),
-            authors=metadata.get('paper_authors', []),
-            year=year,
-            journal=metadata.get('paper_journal'),
-            doi=metadata.get('paper_doi'),
-            url=metadata.get('paper_url'),
-            arxiv_id=metadata.get('paper_arxiv_id'),
-            pubmed_id=metadata.get('paper_pubmed_id')
+        authors = metadata.get('paper_authors', [])
+        cached = _citation_from_fields(
+            metadata.get('paper_title', 'Unknown Title'),
+            tuple(authors),
+            metadata.get('paper_published_date'),
+            metadata.get('paper_journal'),
+            metadata.get('paper_doi'),
+            metadata.get('paper_url'),
+            metadata.get('paper_arxiv_id'),
+            metadata.get('paper_pubmed_id')
         )
+        # Numeric formatting assigns citation_number in place, so hand out
+        # a fresh copy rather than the shared cached instance
+        return replace(cached, authors=list(cached.authors))
     
     def format_apa(self, citation: Citation) -> str:
         """Format citation in APA style"""
@@ -126,17 +167,18 @@ class CitationFormatter:
         
         return f"({author_text}, {year_text})"
     
+    # Bibliography style dispatch resolved through one dict lookup; the
+    # numeric style uses APA entries as its base
+    _BIB_FORMATTERS = {
+        'apa': format_apa,
+        'mla': format_mla,
+        'numeric': format_apa,
+    }
+
     def get_bibliography_entry(self, citation: Citation, style: str = "apa") -> str:
         """Get full bibliography entry for a citation"""
-        if style.lower() == "apa":
-            return self.format_apa(citation)
-        elif style.lower() == "mla":
-            return self.format_mla(citation)
-        elif style.lower() == "numeric":
-            # For numeric style, we need the full citation
-            return self.format_apa(citation)  # Use APA as base
-        else:
-            return self.format_apa(citation)
+        formatter = self._BIB_FORMATTERS.get(style.lower(), CitationFormatter.format_apa)
+        return formatter(self, citation)
     
     def create_citation_map(self, chunks: List[Dict[str, Any]]) -> Dict[str, Citation]:
         """Create a mapping of paper titles to citations"""
@@ -161,8 +203,14 @@ class CitationFormatter:
         # Create citation map
         citation_map = self.create_citation_map(chunks)
         
+        # Resolve the inline formatter once instead of re-dispatching on
+        # the style string for every cited sentence
+        style_lower = style.lower()
+        format_inline = (self.format_author_date if style_lower == "author_date"
+                         else self.format_numeric)
+
         # Reset counter for numeric citations
-        if style.lower() == "numeric":
+        if style_lower == "numeric":
             self.citation_counter = 0
             for citation in citation_map.values():
                 self.citation_counter += 1
@@ -170,59 +218,79 @@ class CitationFormatter:
         
         # Add citations to text (simple approach - add at end of sentences)
         cited_papers = set()
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        
+        sentences = _SENT_SPLIT_RE.split(text)
+
+        # Tokenize every chunk once up front - chunk tokens do not change
+        # across sentences, and re-splitting each chunk per (sentence,
+        # chunk) pair dominated the cost of citation annotation
+        paper_titles = [chunk.get('metadata', {}).get('paper_title') for chunk in chunks]
+        chunk_word_sets = [
+            set(chunk.get('text', '').lower().split()) - _COMMON_WORDS
+            for chunk in chunks
+        ]
+        sentence_word_sets = [
+            set(sentence.lower().split()) - _COMMON_WORDS for sentence in sentences
+        ]
+
+        # All (sentence, chunk) overlap ratios come out of one matrix
+        # product instead of a Python double loop of set intersections;
+        # thresholding the whole grid at once leaves the sentence loop
+        # visiting only actual candidate pairs
+        overlap_ratios = self._overlap_matrix(sentence_word_sets, chunk_word_sets)
+        above_threshold = overlap_ratios > 0.3
+
         cited_text = []
-        for sentence in sentences:
-            sentence_added = False
-            
-            # Check if any chunk content matches this sentence
-            for chunk in chunks:
-                chunk_text = chunk.get('text', '')
-                metadata = chunk.get('metadata', {})
-                paper_title = metadata.get('paper_title')
-                
-                # Simple matching - check if chunk text contains sentence words
-                if paper_title and self._sentence_cites_paper(sentence, chunk_text):
+        for i, sentence in enumerate(sentences):
+            # Check the chunks whose content matches this sentence
+            for j in np.nonzero(above_threshold[i])[0]:
+                paper_title = paper_titles[j]
+                if paper_title:
                     if paper_title not in cited_papers:
                         citation = citation_map[paper_title]
-                        
-                        if style.lower() == "numeric":
-                            citation_text = self.format_numeric(citation)
-                        elif style.lower() == "author_date":
-                            citation_text = self.format_author_date(citation)
-                        else:
-                            citation_text = self.format_numeric(citation)
-                        
-                        sentence += f" {citation_text}"
+                        sentence += f" {format_inline(citation)}"
                         cited_papers.add(paper_title)
-                        sentence_added = True
                         break
-            
+
             cited_text.append(sentence)
-        
+
         return " ".join(cited_text), citation_map
-    
-    def _sentence_cites_paper(self, sentence: str, chunk_text: str) -> bool:
-        """Check if a sentence likely cites content from a chunk"""
-        # Simple heuristic: check if significant words overlap
-        sentence_words = set(sentence.lower().split())
-        chunk_words = set(chunk_text.lower().split())
-        
-        # Remove common words
-        common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'}
-        
-        sentence_words -= common_words
-        chunk_words -= common_words
-        
-        # Check if there's significant overlap
-        if not sentence_words or not chunk_words:
-            return False
-        
-        overlap = len(sentence_words.intersection(chunk_words))
-        overlap_ratio = overlap / len(sentence_words)
-        
-        return overlap_ratio > 0.3  # 30% overlap threshold
+
+    @staticmethod
+    def _overlap_matrix(sentence_word_sets: List[set],
+                        chunk_word_sets: List[set]) -> np.ndarray:
+        """Overlap ratio of every sentence against every chunk
+
+        Word sets become rows of binary term matrices over the chunk
+        vocabulary; one BLAS matmul then yields all intersection counts
+        at once, and each row is divided by its sentence's word count.
+        """
+        n_sentences = len(sentence_word_sets)
+        n_chunks = len(chunk_word_sets)
+
+        # Only words that appear in some chunk can contribute to overlap
+        vocab = {}
+        for words in chunk_word_sets:
+            for word in words:
+                vocab.setdefault(word, len(vocab))
+
+        if not vocab:
+            return np.zeros((n_sentences, n_chunks), dtype=np.float32)
+
+        sentence_matrix = np.zeros((n_sentences, len(vocab)), dtype=np.float32)
+        for i, words in enumerate(sentence_word_sets):
+            indices = [vocab[word] for word in words if word in vocab]
+            sentence_matrix[i, indices] = 1.0
+
+        chunk_matrix = np.zeros((n_chunks, len(vocab)), dtype=np.float32)
+        for j, words in enumerate(chunk_word_sets):
+            chunk_matrix[j, [vocab[word] for word in words]] = 1.0
+
+        counts = sentence_matrix @ chunk_matrix.T
+        denominators = np.fromiter(
+            (len(words) or 1 for words in sentence_word_sets),
+            dtype=np.float32, count=n_sentences
+        )
+        return counts / denominators[:, None]
     
     def generate_bibliography(self, citations: Dict[str, Citation], style: str = "apa") -> str:
         """Generate bibliography from citations"""
@@ -238,8 +306,8 @@ class CitationFormatter:
             # Sort alphabetically by author
             sorted_citations = sorted(citations.values(), key=lambda x: x.authors[0] if x.authors else "Anonymous")
         
+        formatter = self._BIB_FORMATTERS.get(style.lower(), CitationFormatter.format_apa)
         for citation in sorted_citations:
-            entry = self.get_bibliography_entry(citation, style)
-            bibliography_lines.append(entry)
+            bibliography_lines.append(formatter(self, citation))
         
         return "\n\n".join(bibliography_lines)
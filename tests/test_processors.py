@@ -3,6 +3,7 @@ Tests for text processors
 """
 
 import unittest
+import numpy as np
 from src.processors.text_processor import TextProcessor
 from src.processors.chunker import SemanticChunker, Chunk
 from src.fetchers.base_fetcher import Paper
@@ -72,7 +73,7 @@ class TestSemanticChunker(unittest.TestCase):
     
     def test_chunk_paper(self):
         """Test paper chunking"""
-        chunks = self.chunker.chunk_paper(self.paper)
+        chunks = list(self.chunker.chunk_paper(self.paper))
         
         self.assertGreater(len(chunks), 1)  # Should create multiple chunks
         
@@ -82,20 +83,38 @@ class TestSemanticChunker(unittest.TestCase):
             self.assertGreater(len(chunk.text), 0)
             self.assertIsNotNone(chunk.chunk_id)
     
+    def test_chunk_offsets_match_text_length(self):
+        """Test chunk offsets are consistent with chunk text"""
+        for chunk in self.chunker.chunk_paper(self.paper):
+            self.assertEqual(chunk.end_char - chunk.start_char, len(chunk.text))
+
+    def test_no_overlap_only_chunks(self):
+        """Carried overlap must never be emitted as its own chunk"""
+        # With these lengths the overlap paragraph plus the next
+        # paragraph exceed chunk_size, which used to flush a window
+        # fully contained in the previous chunk
+        chunker = SemanticChunker(chunk_size=1000, chunk_overlap=200)
+        lengths = np.array([850, 100, 950], dtype=np.int32)
+        plan = chunker._plan_chunks(lengths)
+
+        self.assertEqual(plan, [(0, 2), (2, 3)])
+        for (prev_start, prev_end), (start, end) in zip(plan, plan[1:]):
+            self.assertFalse(prev_start <= start and end <= prev_end,
+                             f"chunk ({start}, {end}) contained in ({prev_start}, {prev_end})")
+
     def test_chunk_multiple_papers(self):
         """Test chunking multiple papers"""
         papers = [self.paper] * 3
         chunks = self.chunker.chunk_multiple_papers(papers)
         
         self.assertGreater(len(chunks), 3)  # Should create multiple chunks
-        
+
         # Check that all chunks have unique IDs
-        chunk_ids = [chunk.chunk_id for chunk in chunks]
-        self.assertEqual(len(chunk_ids), len(set(chunk_ids)))
+        self.assertEqual(len(chunks.chunk_ids), len(set(chunks.chunk_ids)))
     
     def test_get_chunk_statistics(self):
         """Test chunk statistics"""
-        chunks = self.chunker.chunk_paper(self.paper)
+        chunks = list(self.chunker.chunk_paper(self.paper))
         stats = self.chunker.get_chunk_statistics(chunks)
         
         self.assertIn('total_chunks', stats)